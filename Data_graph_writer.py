@@ -1,6 +1,8 @@
 import os
 import re
 from docx import Document
+from Data_update_log import StorageUpdateLog
+from Scripwriter import BackendScriptWriter
 
 class TableAnalysisExtractor:
     def __init__(self):
@@ -58,10 +60,63 @@ class TableAnalysisExtractor:
         print(f"✅ Extracted {total_rows_extracted} rows from `table_analysis.docx`")
         return graph_plot_info
 
+    def read_existing_graph_entries(self):
+        """
+        Scans `Data_storage_Lib.py` for the current `graph_plot_info` lines without executing it,
+        then overlays the entries still pending in its update log.
+        Returns (has_section, entries) where entries maps repr(date) to the text of the
+        latest assignment line for that date (later lines win, just like when the module runs).
+        """
+        entries = {}
+        has_section = False
+        with open(self.output_file, "r", encoding="utf-8") as f:
+            for line in f:
+                stripped = line.strip()
+                if stripped == "graph_plot_info = {}":
+                    has_section = True
+                    entries.clear()  # Anything above a reset is discarded at import time
+                elif stripped.startswith("graph_plot_info[") and "] = " in stripped:
+                    key_text = stripped[len("graph_plot_info["):stripped.index("] = ")]
+                    entries[key_text] = stripped
+        for op, key, value in StorageUpdateLog(self.output_file).read_records():
+            if op == "graph":
+                entries[repr(key)] = f"graph_plot_info[{repr(key)}] = {value}"
+        return has_section, entries
+
+    def append_data_storage_file(self, graph_plot_info):
+        """
+        Incremental update: records `graph_plot_info[date] = [...]` only for dates that are new
+        or whose points changed since the last run. The entries go to the storage update log
+        and are appended to `Data_storage_Lib.py` when the log is compacted; a changed date is
+        patched by a newer assignment, which overrides the old line when the module is loaded.
+        Falls back to a full compaction when the file has no `graph_plot_info` section yet.
+        """
+        if not os.path.exists(self.output_file):
+            print(f"Error: {self.output_file} not found!")
+            return
+
+        has_section, existing_entries = self.read_existing_graph_entries()
+        if not has_section:
+            self.update_data_storage_file(graph_plot_info)
+            return
+
+        changed_entries = {}
+        for key, value in graph_plot_info.items():
+            line = f"graph_plot_info[{repr(key)}] = {value}"
+            if existing_entries.get(repr(key)) != line:
+                changed_entries[key] = value
+
+        if not changed_entries:
+            print("✅ `graph_plot_info` already up-to-date. No changes made.")
+            return
+
+        StorageUpdateLog(self.output_file).append_graph_entries(changed_entries)
+        print(f"✅ Logged {len(changed_entries)} new/changed `graph_plot_info` entries for {self.output_file}")
+
     def update_data_storage_file(self, graph_plot_info):
         """
-        Completely overwrites the `graph_plot_info` section in `Data_storage_Lib.py`
-        while preserving all other contents.
+        Compaction: completely overwrites the `graph_plot_info` section in `Data_storage_Lib.py`
+        while preserving all other contents. This also drops entries patched by incremental runs.
         """
         if not os.path.exists(self.output_file):
             print(f"Error: {self.output_file} not found!")
@@ -94,16 +149,27 @@ class TableAnalysisExtractor:
         for key, value in graph_plot_info.items():
             updated_data.append(f"graph_plot_info[{repr(key)}] = {value}\n")
 
-        # Save back to file
-        with open(self.output_file, "w", encoding="utf-8") as f:
-            f.writelines(updated_data)
+        # Save back to file (temp file + rename, so a crash never leaves a truncated script)
+        BackendScriptWriter().atomic_write(self.output_file, "".join(updated_data))
+
+        # The rewrite already contains every pending graph entry; the other records are kept
+        update_log = StorageUpdateLog(self.output_file)
+        if os.path.exists(update_log.log_path):
+            pending = [r for r in update_log.read_records() if r[0] != "graph"]
+            update_log.rewrite_records([{"op": op, "name": name, "value": repr(value)} for op, name, value in pending])
 
         print(f"✅ Successfully overwrote `graph_plot_info` in {self.output_file}!")
 
-    def run(self):
-        """Runs the full extraction and update process."""
+    def run(self, compact=False):
+        """
+        Runs the extraction and update process.
+        By default only new/changed dates are appended; pass compact=True for a full rewrite.
+        """
         graph_plot_info = self.extract_table_data()
-        self.update_data_storage_file(graph_plot_info)
+        if compact:
+            self.update_data_storage_file(graph_plot_info)
+        else:
+            self.append_data_storage_file(graph_plot_info)
 
 
 
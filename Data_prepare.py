@@ -1,7 +1,6 @@
 import os
 from Scripwriter import BackendScriptWriter
-import win32com.client
-from ExcelMacroRunner import excel_functions
+from ExcelMacroRunner import get_excel_functions, win32com
 import openpyxl
 from lib_function import Lib_functions,total_list_cal_script
 from words_Main_controller import ExcelToWordConverter
@@ -9,28 +8,26 @@ from Summary_percentage_writer import summary_percentage_writer
 from table_analysis import TablesAnalysis  
 from Data_graph_writer import TableAnalysisExtractor
 from database_analysis import TotoDataFetcher
+from Data_store import ColumnarDataStore
 
-import win32com.client
-
-try:
-    excel = win32com.client.GetActiveObject("Excel.Application")
-    excel.Quit()
-    print("Excel application closed.")
-except Exception as e:
-    print("No active Excel instance found or error closing Excel:", e)
+if win32com is not None:
+    try:
+        excel = win32com.client.GetActiveObject("Excel.Application")
+        excel.Quit()
+        print("Excel application closed.")
+    except Exception as e:
+        print("No active Excel instance found or error closing Excel:", e)
 
 toto_data_fetcher=TotoDataFetcher()
 toto_data_fetcher.run()
-excel_func=excel_functions()
+ColumnarDataStore().sync_draws('database_analysis.xlsx')
+excel_func=get_excel_functions()
 startup=BackendScriptWriter()
-startup.overwritelist_script('Data_Storage_Lib.py', 'C',excel_func.count_column_values('Data', 'C'))
-startup.overwritelist_script('Data_Storage_Lib.py', 'D',excel_func.count_column_values('Data', 'D'))
-startup.overwritelist_script('Data_Storage_Lib.py', 'E',excel_func.count_column_values('Data', 'E'))
-startup.overwritelist_script('Data_Storage_Lib.py', 'F',excel_func.count_column_values('Data', 'F'))
-startup.overwritelist_script('Data_Storage_Lib.py', 'G',excel_func.count_column_values('Data', 'G'))
-startup.overwritelist_script('Data_Storage_Lib.py', 'H',excel_func.count_column_values('Data', 'H'))
-startup.overwritelist_script('Data_Storage_Lib.py', 'I',excel_func.count_column_values('Data', 'I'))
+with startup.transaction('Data_storage_Lib.py') as batch:
+    for column in ['C', 'D', 'E', 'F', 'G', 'H', 'I']:
+        batch[column] = excel_func.count_column_values('Data', column)
 lib_fun=Lib_functions('All')
+lib_fun.list_percent_function()
 lib_fun21=total_list_cal_script()
 lib_fun21.total_list_percent_calculation()    
 excel_converter=ExcelToWordConverter()
@@ -43,10 +40,11 @@ graph_extraction=TableAnalysisExtractor()
 graph_extraction.run()
 
 
-try:
-    excel = win32com.client.GetActiveObject("Excel.Application")
-    excel.Quit()
-    print("Excel application closed.")
-except Exception as e:
-    print("No active Excel instance found or error closing Excel:", e)
+if win32com is not None:
+    try:
+        excel = win32com.client.GetActiveObject("Excel.Application")
+        excel.Quit()
+        print("Excel application closed.")
+    except Exception as e:
+        print("No active Excel instance found or error closing Excel:", e)
 
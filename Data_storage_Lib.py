@@ -5,30 +5,32 @@ F = [7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26
 G = [12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48]
 H = [13, 14, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49]
 I = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49]
-list_percent1 = ['Value 1: (13.17%)', 'Value 2: (10.89%)', 'Value 3: (8.96%)', 'Value 4: (8.90%)', 'Value 5: (8.61%)', 'Value 6: (7.08%)', 'Value 7: (6.15%)', 'Value 8: (6.03%)', 'Value 9: (4.98%)', 'Value 10: (3.81%)', 'Value 11: (3.57%)', 'Value 12: (3.16%)', 'Value 13: (2.40%)', 'Value 14: (2.46%)', 'Value 15: (1.64%)', 'Value 16: (1.41%)', 'Value 17: (1.29%)', 'Value 18: (0.94%)', 'Value 19: (0.59%)', 'Value 20: (0.82%)', 'Value 21: (0.76%)', 'Value 22: (0.76%)', 'Value 23: (0.23%)', 'Value 24: (0.41%)', 'Value 25: (0.29%)', 'Value 26: (0.12%)', 'Value 27: (0.12%)', 'Value 28: (0.06%)', 'Value 29: (0.06%)', 'Value 31: (0.12%)', 'Value 32: (0.06%)', 'Value 33: (0.06%)', 'Value 34: (0.06%)', 'Value 35: (0.06%)']
-list_percent2 = ['Value 2: (1.00%)', 'Value 3: (2.63%)', 'Value 4: (3.81%)', 'Value 5: (3.63%)', 'Value 6: (4.68%)', 'Value 7: (5.21%)', 'Value 8: (5.21%)', 'Value 9: (5.56%)', 'Value 10: (6.38%)', 'Value 11: (5.15%)', 'Value 12: (6.32%)', 'Value 13: (5.21%)', 'Value 14: (4.51%)', 'Value 15: (4.80%)', 'Value 16: (3.81%)', 'Value 17: (3.63%)', 'Value 18: (3.45%)', 'Value 19: (3.45%)', 'Value 20: (3.86%)', 'Value 21: (2.69%)', 'Value 22: (2.87%)', 'Value 23: (2.11%)', 'Value 24: (1.87%)', 'Value 25: (1.29%)', 'Value 26: (1.35%)', 'Value 27: (0.70%)', 'Value 28: (1.05%)', 'Value 29: (0.53%)', 'Value 30: (0.70%)', 'Value 31: (0.70%)', 'Value 32: (0.53%)', 'Value 33: (0.47%)', 'Value 34: (0.18%)', 'Value 35: (0.12%)', 'Value 36: (0.23%)', 'Value 37: (0.18%)', 'Value 38: (0.06%)', 'Value 40: (0.06%)']
-list_percent3 = ['Value 3: (0.06%)', 'Value 4: (0.35%)', 'Value 5: (0.59%)', 'Value 6: (1.05%)', 'Value 7: (1.05%)', 'Value 8: (1.58%)', 'Value 9: (2.63%)', 'Value 10: (2.22%)', 'Value 11: (3.45%)', 'Value 12: (3.04%)', 'Value 13: (4.10%)', 'Value 14: (3.57%)', 'Value 15: (4.80%)', 'Value 16: (4.16%)', 'Value 17: (5.44%)', 'Value 18: (4.80%)', 'Value 19: (4.04%)', 'Value 20: (4.04%)', 'Value 21: (3.81%)', 'Value 22: (5.56%)', 'Value 23: (4.74%)', 'Value 24: (3.63%)', 'Value 25: (3.92%)', 'Value 26: (3.45%)', 'Value 27: (3.57%)', 'Value 28: (2.93%)', 'Value 29: (2.87%)', 'Value 30: (3.22%)', 'Value 31: (2.34%)', 'Value 32: (1.52%)', 'Value 33: (1.58%)', 'Value 34: (1.46%)', 'Value 35: (1.17%)', 'Value 36: (0.70%)', 'Value 37: (0.53%)', 'Value 38: (0.70%)', 'Value 39: (0.35%)', 'Value 40: (0.47%)', 'Value 41: (0.23%)', 'Value 42: (0.12%)', 'Value 43: (0.06%)', 'Value 44: (0.06%)']
-list_percent4 = ['Value 7: (0.12%)', 'Value 8: (0.18%)', 'Value 9: (0.18%)', 'Value 10: (0.41%)', 'Value 11: (0.53%)', 'Value 12: (1.11%)', 'Value 13: (1.00%)', 'Value 14: (0.94%)', 'Value 15: (2.28%)', 'Value 16: (2.22%)', 'Value 17: (2.46%)', 'Value 18: (2.28%)', 'Value 19: (2.81%)', 'Value 20: (3.22%)', 'Value 21: (3.81%)', 'Value 22: (3.69%)', 'Value 23: (4.39%)', 'Value 24: (4.16%)', 'Value 25: (3.40%)', 'Value 26: (3.75%)', 'Value 27: (5.44%)', 'Value 28: (5.44%)', 'Value 29: (3.86%)', 'Value 30: (4.74%)', 'Value 31: (4.86%)', 'Value 32: (4.63%)', 'Value 33: (3.28%)', 'Value 34: (3.81%)', 'Value 35: (2.87%)', 'Value 36: (4.22%)', 'Value 37: (2.46%)', 'Value 38: (2.75%)', 'Value 39: (2.28%)', 'Value 40: (1.99%)', 'Value 41: (1.23%)', 'Value 42: (1.11%)', 'Value 43: (0.88%)', 'Value 44: (0.41%)', 'Value 45: (0.59%)', 'Value 46: (0.18%)', 'Value 47: (0.06%)']
-list_percent5 = ['Value 12: (0.06%)', 'Value 13: (0.12%)', 'Value 14: (0.29%)', 'Value 15: (0.23%)', 'Value 16: (0.41%)', 'Value 17: (0.35%)', 'Value 18: (0.70%)', 'Value 19: (0.70%)', 'Value 20: (0.70%)', 'Value 21: (1.35%)', 'Value 22: (1.58%)', 'Value 23: (1.87%)', 'Value 24: (2.22%)', 'Value 25: (2.28%)', 'Value 26: (2.63%)', 'Value 27: (3.04%)', 'Value 28: (3.34%)', 'Value 29: (3.86%)', 'Value 30: (2.87%)', 'Value 31: (4.10%)', 'Value 32: (4.86%)', 'Value 33: (4.04%)', 'Value 34: (4.68%)', 'Value 35: (4.63%)', 'Value 36: (5.04%)', 'Value 37: (5.74%)', 'Value 38: (4.39%)', 'Value 39: (5.62%)', 'Value 40: (5.27%)', 'Value 41: (5.56%)', 'Value 42: (3.92%)', 'Value 43: (3.63%)', 'Value 44: (3.63%)', 'Value 45: (2.17%)', 'Value 46: (2.05%)', 'Value 47: (1.00%)', 'Value 48: (1.05%)']
-list_percent6 = ['Value 13: (0.06%)', 'Value 14: (0.06%)', 'Value 19: (0.12%)', 'Value 20: (0.12%)', 'Value 21: (0.18%)', 'Value 22: (0.12%)', 'Value 23: (0.23%)', 'Value 24: (0.18%)', 'Value 25: (0.18%)', 'Value 26: (0.47%)', 'Value 27: (0.59%)', 'Value 28: (0.64%)', 'Value 29: (1.11%)', 'Value 30: (1.52%)', 'Value 31: (1.81%)', 'Value 32: (1.76%)', 'Value 33: (1.93%)', 'Value 34: (2.05%)', 'Value 35: (2.58%)', 'Value 36: (3.51%)', 'Value 37: (3.57%)', 'Value 38: (4.10%)', 'Value 39: (3.63%)', 'Value 40: (5.56%)', 'Value 41: (5.09%)', 'Value 42: (6.32%)', 'Value 43: (7.73%)', 'Value 44: (9.13%)', 'Value 45: (8.72%)', 'Value 46: (6.03%)', 'Value 47: (6.15%)', 'Value 48: (6.67%)', 'Value 49: (8.08%)']
-list_percent7 = ['Value 1: (2.81%)', 'Value 2: (2.28%)', 'Value 3: (1.87%)', 'Value 4: (1.64%)', 'Value 5: (1.64%)', 'Value 6: (2.63%)', 'Value 7: (2.05%)', 'Value 8: (2.46%)', 'Value 9: (1.81%)', 'Value 10: (2.46%)', 'Value 11: (1.41%)', 'Value 12: (2.28%)', 'Value 13: (1.81%)', 'Value 14: (1.76%)', 'Value 15: (2.28%)', 'Value 16: (2.63%)', 'Value 17: (2.40%)', 'Value 18: (2.40%)', 'Value 19: (1.93%)', 'Value 20: (2.28%)', 'Value 21: (2.11%)', 'Value 22: (2.11%)', 'Value 23: (1.93%)', 'Value 24: (2.17%)', 'Value 25: (2.05%)', 'Value 26: (2.58%)', 'Value 27: (1.76%)', 'Value 28: (1.76%)', 'Value 29: (2.52%)', 'Value 30: (2.05%)', 'Value 31: (2.28%)', 'Value 32: (1.46%)', 'Value 33: (2.28%)', 'Value 34: (2.28%)', 'Value 35: (2.17%)', 'Value 36: (1.81%)', 'Value 37: (2.05%)', 'Value 38: (1.93%)', 'Value 39: (1.76%)', 'Value 40: (1.58%)', 'Value 41: (2.58%)', 'Value 42: (2.17%)', 'Value 43: (1.99%)', 'Value 44: (2.11%)', 'Value 45: (2.05%)', 'Value 46: (1.23%)', 'Value 47: (1.17%)', 'Value 48: (1.70%)', 'Value 49: (1.52%)']
-list_highest1 = [(1, 13.173302107728338), (2, 10.889929742388759), (3, 8.957845433255269)]
-list_highest2 = [(10, 6.381733021077284), (12, 6.323185011709602), (9, 5.562060889929742)]
-list_highest3 = [(22, 5.562060889929742), (17, 5.444964871194379), (15, 4.8009367681498825)]
-list_highest4 = [(27, 5.444964871194379), (28, 5.444964871194379), (31, 4.859484777517564)]
-list_highest5 = [(37, 5.737704918032787), (39, 5.620608899297424), (41, 5.562060889929742)]
-list_highest6 = [(44, 9.133489461358314), (45, 8.723653395784543), (49, 8.079625292740047)]
-list_highest7 = [(1, 2.810304449648712), (6, 2.6346604215456675), (16, 2.6346604215456675)]
-list_lowest1 = [(28, 0.0585480093676815), (29, 0.0585480093676815), (32, 0.0585480093676815)]
-list_lowest2 = [(38, 0.0585480093676815), (40, 0.0585480093676815), (35, 0.117096018735363)]
-list_lowest3 = [(3, 0.0585480093676815), (43, 0.0585480093676815), (44, 0.0585480093676815)]
-list_lowest4 = [(47, 0.0585480093676815), (7, 0.117096018735363), (8, 0.1756440281030445)]
-list_lowest5 = [(12, 0.0585480093676815), (13, 0.117096018735363), (15, 0.234192037470726)]
-list_lowest6 = [(13, 0.0585480093676815), (14, 0.0585480093676815), (19, 0.117096018735363)]
-list_lowest7 = [(47, 1.1709601873536302), (46, 1.2295081967213115), (11, 1.405152224824356)]
-total_percent_list = ['Value 22: (2.38%)', 'Value 31: (2.32%)', 'Value 15: (2.29%)', 'Value 1: (2.28%)', 'Value 12: (2.28%)', 'Value 17: (2.22%)', 'Value 36: (2.22%)', 'Value 23: (2.21%)', 'Value 6: (2.21%)', 'Value 8: (2.21%)', 'Value 44: (2.19%)', 'Value 10: (2.18%)', 'Value 27: (2.17%)', 'Value 28: (2.17%)', 'Value 9: (2.17%)', 'Value 30: (2.16%)', 'Value 20: (2.15%)', 'Value 40: (2.13%)', 'Value 29: (2.12%)', 'Value 32: (2.12%)', 'Value 13: (2.10%)', 'Value 21: (2.10%)', 'Value 4: (2.10%)', 'Value 41: (2.10%)', 'Value 16: (2.09%)', 'Value 24: (2.09%)', 'Value 18: (2.08%)', 'Value 37: (2.08%)', 'Value 7: (2.08%)', 'Value 34: (2.07%)', 'Value 5: (2.07%)', 'Value 26: (2.05%)', 'Value 43: (2.04%)', 'Value 11: (2.02%)', 'Value 2: (2.02%)', 'Value 38: (1.99%)', 'Value 19: (1.95%)', 'Value 33: (1.95%)', 'Value 39: (1.95%)', 'Value 42: (1.95%)', 'Value 14: (1.94%)', 'Value 35: (1.94%)', 'Value 3: (1.93%)', 'Value 45: (1.93%)', 'Value 25: (1.92%)', 'Value 49: (1.37%)', 'Value 46: (1.36%)', 'Value 48: (1.35%)', 'Value 47: (1.20%)']
-total_percent_highest3 = ['Value 22: (2.38%)', 'Value 31: (2.32%)', 'Value 15: (2.29%)']
-total_percent_lowest3 = ['Value 46: (1.36%)', 'Value 48: (1.35%)', 'Value 47: (1.20%)']
+list_percent1 = ['Value 1: (13.30%)', 'Value 2: (10.85%)', 'Value 3: (8.98%)', 'Value 4: (8.87%)', 'Value 5: (8.63%)', 'Value 6: (7.06%)', 'Value 7: (6.13%)', 'Value 8: (6.01%)', 'Value 9: (4.96%)', 'Value 10: (3.79%)', 'Value 11: (3.56%)', 'Value 12: (3.15%)', 'Value 13: (2.39%)', 'Value 14: (2.45%)', 'Value 15: (1.63%)', 'Value 16: (1.46%)', 'Value 17: (1.28%)', 'Value 18: (0.93%)', 'Value 19: (0.58%)', 'Value 20: (0.82%)', 'Value 21: (0.76%)', 'Value 22: (0.76%)', 'Value 23: (0.23%)', 'Value 24: (0.41%)', 'Value 25: (0.29%)', 'Value 26: (0.12%)', 'Value 27: (0.12%)', 'Value 28: (0.06%)', 'Value 29: (0.06%)', 'Value 31: (0.12%)', 'Value 32: (0.06%)', 'Value 33: (0.06%)', 'Value 34: (0.06%)', 'Value 35: (0.06%)']
+list_percent2 = ['Value 2: (0.99%)', 'Value 3: (2.68%)', 'Value 4: (3.79%)', 'Value 5: (3.62%)', 'Value 6: (4.67%)', 'Value 7: (5.19%)', 'Value 8: (5.25%)', 'Value 9: (5.54%)', 'Value 10: (6.36%)', 'Value 11: (5.13%)', 'Value 12: (6.36%)', 'Value 13: (5.19%)', 'Value 14: (4.49%)', 'Value 15: (4.78%)', 'Value 16: (3.85%)', 'Value 17: (3.62%)', 'Value 18: (3.50%)', 'Value 19: (3.44%)', 'Value 20: (3.85%)', 'Value 21: (2.68%)', 'Value 22: (2.86%)', 'Value 23: (2.10%)', 'Value 24: (1.87%)', 'Value 25: (1.34%)', 'Value 26: (1.34%)', 'Value 27: (0.70%)', 'Value 28: (1.05%)', 'Value 29: (0.53%)', 'Value 30: (0.70%)', 'Value 31: (0.70%)', 'Value 32: (0.53%)', 'Value 33: (0.47%)', 'Value 34: (0.18%)', 'Value 35: (0.12%)', 'Value 36: (0.23%)', 'Value 37: (0.18%)', 'Value 38: (0.06%)', 'Value 40: (0.06%)']
+list_percent3 = ['Value 3: (0.06%)', 'Value 4: (0.35%)', 'Value 5: (0.58%)', 'Value 6: (1.05%)', 'Value 7: (1.11%)', 'Value 8: (1.58%)', 'Value 9: (2.63%)', 'Value 10: (2.22%)', 'Value 11: (3.44%)', 'Value 12: (3.03%)', 'Value 13: (4.14%)', 'Value 14: (3.56%)', 'Value 15: (4.78%)', 'Value 16: (4.14%)', 'Value 17: (5.43%)', 'Value 18: (4.78%)', 'Value 19: (4.03%)', 'Value 20: (4.03%)', 'Value 21: (3.79%)', 'Value 22: (5.60%)', 'Value 23: (4.78%)', 'Value 24: (3.62%)', 'Value 25: (3.91%)', 'Value 26: (3.44%)', 'Value 27: (3.56%)', 'Value 28: (2.92%)', 'Value 29: (2.92%)', 'Value 30: (3.21%)', 'Value 31: (2.39%)', 'Value 32: (1.52%)', 'Value 33: (1.58%)', 'Value 34: (1.46%)', 'Value 35: (1.17%)', 'Value 36: (0.70%)', 'Value 37: (0.53%)', 'Value 38: (0.70%)', 'Value 39: (0.35%)', 'Value 40: (0.47%)', 'Value 41: (0.23%)', 'Value 42: (0.12%)', 'Value 43: (0.06%)', 'Value 44: (0.06%)']
+list_percent4 = ['Value 7: (0.12%)', 'Value 8: (0.18%)', 'Value 9: (0.18%)', 'Value 10: (0.41%)', 'Value 11: (0.53%)', 'Value 12: (1.11%)', 'Value 13: (0.99%)', 'Value 14: (0.93%)', 'Value 15: (2.28%)', 'Value 16: (2.22%)', 'Value 17: (2.45%)', 'Value 18: (2.33%)', 'Value 19: (2.80%)', 'Value 20: (3.21%)', 'Value 21: (3.79%)', 'Value 22: (3.68%)', 'Value 23: (4.43%)', 'Value 24: (4.14%)', 'Value 25: (3.38%)', 'Value 26: (3.73%)', 'Value 27: (5.43%)', 'Value 28: (5.48%)', 'Value 29: (3.85%)', 'Value 30: (4.73%)', 'Value 31: (4.90%)', 'Value 32: (4.61%)', 'Value 33: (3.27%)', 'Value 34: (3.79%)', 'Value 35: (2.86%)', 'Value 36: (4.20%)', 'Value 37: (2.51%)', 'Value 38: (2.74%)', 'Value 39: (2.33%)', 'Value 40: (1.98%)', 'Value 41: (1.23%)', 'Value 42: (1.11%)', 'Value 43: (0.88%)', 'Value 44: (0.41%)', 'Value 45: (0.58%)', 'Value 46: (0.18%)', 'Value 47: (0.06%)']
+list_percent5 = ['Value 12: (0.06%)', 'Value 13: (0.12%)', 'Value 14: (0.29%)', 'Value 15: (0.23%)', 'Value 16: (0.41%)', 'Value 17: (0.35%)', 'Value 18: (0.70%)', 'Value 19: (0.70%)', 'Value 20: (0.70%)', 'Value 21: (1.34%)', 'Value 22: (1.58%)', 'Value 23: (1.87%)', 'Value 24: (2.22%)', 'Value 25: (2.28%)', 'Value 26: (2.63%)', 'Value 27: (3.03%)', 'Value 28: (3.38%)', 'Value 29: (3.85%)', 'Value 30: (2.92%)', 'Value 31: (4.08%)', 'Value 32: (4.84%)', 'Value 33: (4.03%)', 'Value 34: (4.73%)', 'Value 35: (4.61%)', 'Value 36: (5.02%)', 'Value 37: (5.72%)', 'Value 38: (4.38%)', 'Value 39: (5.66%)', 'Value 40: (5.25%)', 'Value 41: (5.66%)', 'Value 42: (3.91%)', 'Value 43: (3.62%)', 'Value 44: (3.62%)', 'Value 45: (2.16%)', 'Value 46: (2.04%)', 'Value 47: (0.99%)', 'Value 48: (1.05%)']
+list_percent6 = ['Value 13: (0.06%)', 'Value 14: (0.06%)', 'Value 19: (0.12%)', 'Value 20: (0.12%)', 'Value 21: (0.18%)', 'Value 22: (0.12%)', 'Value 23: (0.23%)', 'Value 24: (0.18%)', 'Value 25: (0.18%)', 'Value 26: (0.47%)', 'Value 27: (0.58%)', 'Value 28: (0.64%)', 'Value 29: (1.11%)', 'Value 30: (1.52%)', 'Value 31: (1.81%)', 'Value 32: (1.75%)', 'Value 33: (1.93%)', 'Value 34: (2.04%)', 'Value 35: (2.63%)', 'Value 36: (3.50%)', 'Value 37: (3.56%)', 'Value 38: (4.08%)', 'Value 39: (3.68%)', 'Value 40: (5.54%)', 'Value 41: (5.08%)', 'Value 42: (6.42%)', 'Value 43: (7.70%)', 'Value 44: (9.10%)', 'Value 45: (8.69%)', 'Value 46: (6.01%)', 'Value 47: (6.13%)', 'Value 48: (6.71%)', 'Value 49: (8.11%)']
+list_percent7 = ['Value 1: (2.80%)', 'Value 2: (2.28%)', 'Value 3: (1.87%)', 'Value 4: (1.63%)', 'Value 5: (1.63%)', 'Value 6: (2.63%)', 'Value 7: (2.04%)', 'Value 8: (2.45%)', 'Value 9: (1.87%)', 'Value 10: (2.45%)', 'Value 11: (1.40%)', 'Value 12: (2.28%)', 'Value 13: (1.81%)', 'Value 14: (1.75%)', 'Value 15: (2.28%)', 'Value 16: (2.63%)', 'Value 17: (2.45%)', 'Value 18: (2.39%)', 'Value 19: (1.93%)', 'Value 20: (2.28%)', 'Value 21: (2.16%)', 'Value 22: (2.10%)', 'Value 23: (1.93%)', 'Value 24: (2.16%)', 'Value 25: (2.10%)', 'Value 26: (2.57%)', 'Value 27: (1.75%)', 'Value 28: (1.75%)', 'Value 29: (2.51%)', 'Value 30: (2.04%)', 'Value 31: (2.28%)', 'Value 32: (1.52%)', 'Value 33: (2.28%)', 'Value 34: (2.28%)', 'Value 35: (2.16%)', 'Value 36: (1.81%)', 'Value 37: (2.04%)', 'Value 38: (1.93%)', 'Value 39: (1.75%)', 'Value 40: (1.58%)', 'Value 41: (2.57%)', 'Value 42: (2.16%)', 'Value 43: (1.98%)', 'Value 44: (2.10%)', 'Value 45: (2.04%)', 'Value 46: (1.28%)', 'Value 47: (1.17%)', 'Value 48: (1.69%)', 'Value 49: (1.52%)']
+list_highest1 = [(1, 13.302217036172696), (2, 10.851808634772462), (3, 8.98483080513419)]
+list_highest2 = [(10, 6.359393232205369), (12, 6.359393232205369), (9, 5.542590431738623)]
+list_highest3 = [(22, 5.600933488914819), (17, 5.425904317386231), (15, 4.784130688448075)]
+list_highest4 = [(28, 5.484247374562427), (27, 5.425904317386231), (31, 4.900816802800467)]
+list_highest5 = [(37, 5.717619603267211), (39, 5.659276546091015), (41, 5.659276546091015)]
+list_highest6 = [(44, 9.101516919486581), (45, 8.693115519253208), (49, 8.109684947491248)]
+list_highest7 = [(1, 2.8004667444574096), (6, 2.6254375729288215), (16, 2.6254375729288215)]
+list_lowest1 = [(28, 0.05834305717619603), (29, 0.05834305717619603), (32, 0.05834305717619603)]
+list_lowest2 = [(38, 0.05834305717619603), (40, 0.05834305717619603), (35, 0.11668611435239205)]
+list_lowest3 = [(3, 0.05834305717619603), (43, 0.05834305717619603), (44, 0.05834305717619603)]
+list_lowest4 = [(47, 0.05834305717619603), (7, 0.11668611435239205), (8, 0.1750291715285881)]
+list_lowest5 = [(12, 0.05834305717619603), (13, 0.11668611435239205), (15, 0.2333722287047841)]
+list_lowest6 = [(13, 0.05834305717619603), (14, 0.05834305717619603), (19, 0.11668611435239205)]
+list_lowest7 = [(47, 1.1668611435239207), (46, 1.2835472578763127), (11, 1.4002333722287048)]
+total_percent_list = ['Value 22: (2.38%)', 'Value 31: (2.33%)', 'Value 1: (2.30%)', 'Value 12: (2.28%)', 'Value 15: (2.28%)', 'Value 17: (2.23%)', 'Value 23: (2.23%)', 'Value 8: (2.21%)', 'Value 36: (2.21%)', 'Value 6: (2.20%)', 'Value 10: (2.18%)', 'Value 28: (2.18%)', 'Value 44: (2.18%)', 'Value 9: (2.17%)', 'Value 27: (2.17%)', 'Value 30: (2.16%)', 'Value 20: (2.14%)', 'Value 40: (2.13%)', 'Value 29: (2.12%)', 'Value 32: (2.12%)', 'Value 41: (2.11%)', 'Value 13: (2.10%)', 'Value 16: (2.10%)', 'Value 21: (2.10%)', 'Value 4: (2.09%)', 'Value 18: (2.09%)', 'Value 7: (2.08%)', 'Value 24: (2.08%)', 'Value 34: (2.08%)', 'Value 37: (2.08%)', 'Value 5: (2.07%)', 'Value 26: (2.04%)', 'Value 43: (2.03%)', 'Value 2: (2.02%)', 'Value 11: (2.01%)', 'Value 38: (1.98%)', 'Value 39: (1.97%)', 'Value 42: (1.96%)', 'Value 3: (1.94%)', 'Value 19: (1.94%)', 'Value 33: (1.94%)', 'Value 35: (1.94%)', 'Value 14: (1.93%)', 'Value 25: (1.93%)', 'Value 45: (1.93%)', 'Value 49: (1.38%)', 'Value 46: (1.36%)', 'Value 48: (1.35%)', 'Value 47: (1.19%)']
+total_percent_highest3 = ['Value 22: (2.38%)', 'Value 31: (2.33%)', 'Value 1: (2.30%)']
+total_percent_lowest3 = ['Value 46: (1.36%)', 'Value 48: (1.35%)', 'Value 47: (1.19%)']
+position_counts = [[0, 228, 186, 154, 152, 148, 121, 105, 103, 85, 65, 61, 54, 41, 42, 28, 25, 22, 16, 10, 14, 13, 13, 4, 7, 5, 2, 2, 1, 1, 0, 2, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], [0, 0, 17, 46, 65, 62, 80, 89, 90, 95, 109, 88, 109, 89, 77, 82, 66, 62, 60, 59, 66, 46, 49, 36, 32, 23, 23, 12, 18, 9, 12, 12, 9, 8, 3, 2, 4, 3, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 1, 6, 10, 18, 19, 27, 45, 38, 59, 52, 71, 61, 82, 71, 93, 82, 69, 69, 65, 96, 82, 62, 67, 59, 61, 50, 50, 55, 41, 26, 27, 25, 20, 12, 9, 12, 6, 8, 4, 2, 1, 1, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 2, 3, 3, 7, 9, 19, 17, 16, 39, 38, 42, 40, 48, 55, 65, 63, 76, 71, 58, 64, 93, 94, 66, 81, 84, 79, 56, 65, 49, 72, 43, 47, 40, 34, 21, 19, 15, 7, 10, 3, 1, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 5, 4, 7, 6, 12, 12, 12, 23, 27, 32, 38, 39, 45, 52, 58, 66, 50, 70, 83, 69, 81, 79, 86, 98, 75, 97, 90, 97, 67, 62, 62, 37, 35, 17, 18, 0], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 2, 2, 3, 2, 4, 3, 3, 8, 10, 11, 19, 26, 31, 30, 33, 35, 45, 60, 61, 70, 63, 95, 87, 110, 132, 156, 149, 103, 105, 115, 139], [0, 48, 39, 32, 28, 28, 45, 35, 42, 32, 42, 24, 39, 31, 30, 39, 45, 42, 41, 33, 39, 37, 36, 33, 37, 36, 44, 30, 30, 43, 35, 39, 26, 39, 39, 37, 31, 35, 33, 30, 27, 44, 37, 34, 36, 35, 22, 20, 29, 26]]
+draw_total = 1714
 list_percent_call_all = [list_percent1, list_percent2, list_percent3, list_percent4, list_percent5, list_percent6, list_percent7]
 list_pattern = []
 list_pattern_common = []
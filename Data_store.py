@@ -0,0 +1,446 @@
+import os
+import re
+import mmap
+import pickle
+import struct
+import hashlib
+import numpy as np
+from Data_update_log import StorageUpdateLog
+from Draw_matrix import DrawMatrix
+from Frequency_engine import build_count_cube, CountCube
+
+STORE_DIRNAME = "data_store"
+POSITION_KEYS = ["C", "D", "E", "F", "G", "H", "I"]
+PERCENT_KEYS = [f"list_percent{i}" for i in range(1, 8)]
+COLUMNAR_NAMES = set(POSITION_KEYS) | set(PERCENT_KEYS) | {"graph_plot_info", "predict_dict", "list_percent_call_all",
+                                                          "position_counts"}
+
+
+class ColumnarDataStore:
+    """
+    Binary columnar copy of the analysis database (Data_storage_Lib.py) and of the draw
+    history in database_analysis.xlsx.
+
+    Every array lives in its own .npy file inside `data_store/` so readers can
+    memory-map it instead of executing 1,700+ lines of Python source:
+      - draws.npy / draw_dates.npy        : N x 8 int32 (draw no. + 7 numbers) and datetime64[D]
+      - count_cube.npy / count_cube_all.npy : (N+1) x 7 x 50 and (N+1) x 50 int32 prefix counts
+      - positions.npy (+ _offsets)        : the per-position lists C..I
+      - list_percent.npy (+ _offsets)     : list_percent1..7
+      - graph_dates.npy, graph_points.npy (+ _offsets) : graph_plot_info
+      - predict_keys.npy, predict_points.npy (+ _offsets) : predict_dict
+      - position_counts.npy               : 7 x 50 int32 occurrence counts (percentages derived on read)
+    The remaining small variables and the variable order sit on top in a StorageSnapshot,
+    written last and keyed by the content hash of the script and its update log, so a
+    matching snapshot means every namespace array belongs to that version of the source.
+    """
+
+    def __init__(self, script_path=None, store_dir=None):
+        self.script_path = script_path or os.path.join(os.getcwd(), "Data_storage_Lib.py")
+        self.store_dir = store_dir or os.path.join(os.path.dirname(os.path.abspath(self.script_path)), STORE_DIRNAME)
+
+    # ---------- low level helpers ----------
+    def _path(self, name):
+        return os.path.join(self.store_dir, f"{name}.npy")
+
+    def _save(self, name, array):
+        """
+        Writes an array to a temporary file first and swaps it in, so a reader
+        never memory-maps a half written file.
+        """
+        tmp_path = self._path(name) + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp_path, self._path(name))
+
+    def _load(self, name):
+        return np.load(self._path(name), mmap_mode="r")
+
+    def _save_ragged(self, name, sequences, dtype, width=None):
+        """
+        Stores a list of variable-length sequences as one flat array plus an offsets array
+        (rows of `width` values each when width is given).
+        """
+        offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+        for i, seq in enumerate(sequences):
+            offsets[i + 1] = offsets[i] + len(seq)
+        flat = np.asarray([item for seq in sequences for item in seq], dtype=dtype)
+        self._save(name, flat if width is None else flat.reshape(-1, width))
+        self._save(f"{name}_offsets", offsets)
+
+    def _load_ragged(self, name):
+        """
+        The flat memory-mapped array and the offsets (as a list) written by _save_ragged.
+        """
+        return self._load(name), self._load(f"{name}_offsets").tolist()
+
+    def _points_dict(self, keys_name, points_name):
+        flat, offsets = self._load_ragged(points_name)
+        points = flat.tolist()
+        return {
+            str(key): [(int(x), y) for x, y in points[offsets[i]:offsets[i + 1]]]
+            for i, key in enumerate(self._load(keys_name).tolist())
+        }
+
+    def snapshot(self):
+        return StorageSnapshot(self.script_path, self.store_dir)
+
+    # ---------- namespace (Data_storage_Lib.py) ----------
+    def write_namespace(self, ns, source_hash=None):
+        """
+        Stores an evaluated Data_storage_Lib namespace: the list/array variables as columnar
+        arrays, then everything else in the snapshot, which commits this version of the store.
+        """
+        snapshot = self.snapshot()
+        source_hash = source_hash or snapshot.source_hash()
+        os.makedirs(self.store_dir, exist_ok=True)
+
+        self._save_ragged("positions", [ns.get(key, []) for key in POSITION_KEYS], np.int16)
+        self._save_ragged("list_percent", [ns.get(key, []) for key in PERCENT_KEYS], np.str_)
+
+        graph_plot_info = ns.get("graph_plot_info", {})
+        self._save("graph_dates", np.asarray(list(graph_plot_info.keys()), dtype=np.str_))
+        self._save_ragged("graph_points", list(graph_plot_info.values()), np.float64, width=2)
+
+        predict_dict = ns.get("predict_dict", {})
+        self._save("predict_keys", np.asarray(list(predict_dict.keys()), dtype=np.str_))
+        self._save_ragged("predict_points", list(predict_dict.values()), np.float64, width=2)
+
+        if "position_counts" in ns:
+            self._save("position_counts", position_counts_array(ns["position_counts"]))
+
+        scalars = {name: value for name, value in ns.items() if name not in COLUMNAR_NAMES}
+        snapshot.save({"names": list(ns.keys()), "scalars": scalars}, source_hash)
+        print(f"✅ Columnar store updated in {self.store_dir}")
+
+    def load_namespace(self, source_hash=None):
+        """
+        Rebuilds the Data_storage_Lib names (C..I, list_percent1..7, graph_plot_info,
+        predict_dict, position_counts and the remaining variables) from the memory-mapped
+        columnar files. Returns None when the store was not built from the current source.
+        """
+        header = self.snapshot().load(source_hash)
+        if header is None:
+            return None
+        names = header["names"]
+        ns = dict(header["scalars"])
+        flat, offsets = self._load_ragged("positions")
+        for i, key in enumerate(POSITION_KEYS):
+            ns[key] = flat[offsets[i]:offsets[i + 1]].tolist()
+        flat, offsets = self._load_ragged("list_percent")
+        for i, key in enumerate(PERCENT_KEYS):
+            ns[key] = flat[offsets[i]:offsets[i + 1]].tolist()
+        ns["list_percent_call_all"] = [ns[key] for key in PERCENT_KEYS]
+        ns["graph_plot_info"] = self._points_dict("graph_dates", "graph_points")
+        ns["predict_dict"] = self._points_dict("predict_keys", "predict_points")
+        if "position_counts" in names:
+            ns["position_counts"] = self._load("position_counts")
+        # Keep the variable order of the source file
+        return {name: ns[name] for name in names if name in ns}
+
+    # ---------- draws (database_analysis.xlsx) ----------
+    def sync_draws(self, workbook_path="database_analysis.xlsx", sheet_name="Data"):
+        """
+        Copies the draw history from the workbook into draws.npy / draw_dates.npy
+        (oldest draw first), using the shared DrawMatrix scan of the sheet, and rebuilds
+        the prefix-sum count cubes used for range frequencies.
+        """
+        matrix = DrawMatrix.get(workbook_path, sheet_name)
+        rows = np.column_stack([matrix.draw_nos, matrix.numbers.astype(np.int32)])
+        order = np.argsort(matrix.draw_nos, kind="stable")
+        os.makedirs(self.store_dir, exist_ok=True)
+        self._save("draws", rows.reshape(-1, 8)[order])
+        self._save("draw_dates", matrix.dates[order])
+        cube = build_count_cube(matrix.numbers[order])
+        self._save("count_cube", cube)
+        self._save("count_cube_all", cube.sum(axis=1, dtype=np.int32))
+        print(f"✅ Stored {len(rows)} draws in {self.store_dir}")
+
+    def read_draws(self):
+        """
+        Returns (draws, draw_dates) as read-only memory maps.
+        """
+        return self._load("draws"), self._load("draw_dates")
+
+    def read_count_cube(self):
+        """
+        CountCube over the memory-mapped prefix counts written by sync_draws.
+        """
+        draws, dates = self.read_draws()
+        return CountCube(draws[:, 0], dates, self._load("count_cube"), self._load("count_cube_all"))
+
+
+def exec_storage_script(script_path):
+    """
+    Executes Data_storage_Lib.py, replays its pending update log and returns the
+    public variables as a dict.
+    """
+    with open(script_path, "r", encoding="utf-8") as f:
+        source = f.read()
+    ns = {}
+    exec(compile(source, script_path, "exec"), ns)
+    ns = {name: value for name, value in ns.items() if not name.startswith("__")}
+    StorageUpdateLog(script_path).replay(ns)
+    if "position_counts" in ns:
+        ns["position_counts"] = position_counts_array(ns["position_counts"])
+    return ns
+
+
+def position_counts_array(value):
+    """
+    Raw per-position counts are exposed as a 7 x 50 int array by every loader.
+    """
+    return np.asarray(value, dtype=np.int32).reshape(-1, 50)
+
+
+class StorageSnapshot:
+    """
+    Data serialised with pickle protocol 5, keyed by the SHA-256 of the source file (used by
+    ColumnarDataStore for the non-columnar Data_storage_Lib variables). NumPy arrays in the namespace are written as out-of-band
+    buffers after the pickle stream and the file is memory-mapped on load, so those arrays
+    are read-only views of the mapping, not copies. The mapping stays open while such arrays
+    are alive (on Windows the snapshot cannot be replaced meanwhile; save then fails with an
+    OSError and the next load rebuilds it); without buffers it is closed right after loading.
+
+    File layout (data_store/snapshot.bin):
+      magic | sha256 of source | pickle length | buffer count | buffer lengths | pickle | buffers
+    """
+    MAGIC = b"DSLSNAP1"
+
+    def __init__(self, script_path, store_dir):
+        self.script_path = script_path
+        self.snapshot_path = os.path.join(store_dir, "snapshot.bin")
+
+    def source_hash(self):
+        """
+        SHA-256 over the script and its pending update log.
+        """
+        digest = hashlib.sha256()
+        with open(self.script_path, "rb") as f:
+            digest.update(f.read())
+        log_path = StorageUpdateLog(self.script_path).log_path
+        if os.path.exists(log_path):
+            with open(log_path, "rb") as f:
+                digest.update(b"\0log\0" + f.read())
+        return digest.digest()
+
+    def load(self, source_hash=None):
+        """
+        Returns the namespace if the snapshot matches the current source, else None.
+        """
+        if not os.path.exists(self.snapshot_path):
+            return None
+        source_hash = source_hash or self.source_hash()
+        header_size = len(self.MAGIC) + 32 + 12
+        with open(self.snapshot_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < header_size:
+                return None
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if data[:len(self.MAGIC)] != self.MAGIC or data[len(self.MAGIC):len(self.MAGIC) + 32] != source_hash:
+            data.close()
+            return None
+        payload_size, buffer_count = struct.unpack_from("<QI", data, len(self.MAGIC) + 32)
+        buffer_sizes = struct.unpack_from(f"<{buffer_count}Q", data, header_size)
+        offset = header_size + 8 * buffer_count
+        view = memoryview(data)
+        payload = view[offset:offset + payload_size]
+        offset += payload_size
+        buffers = []
+        for size in buffer_sizes:
+            buffers.append(view[offset:offset + size])
+            offset += size
+        try:
+            ns = pickle.loads(payload, buffers=buffers)
+        except Exception as e:
+            print(f"Snapshot unreadable ({e}), rebuilding from source.")
+            ns = None
+        if ns is None or not buffers:
+            # Nothing refers to the mapping any more
+            for part in [payload, *buffers, view]:
+                part.release()
+            try:
+                data.close()
+            except BufferError:
+                pass
+        return ns
+
+    def save(self, ns, source_hash=None):
+        source_hash = source_hash or self.source_hash()
+        buffers = []
+        payload = pickle.dumps(ns, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+        os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(source_hash)
+            f.write(struct.pack("<QI", len(payload), len(raw_buffers)))
+            f.write(struct.pack(f"<{len(raw_buffers)}Q", *(len(b) for b in raw_buffers)))
+            f.write(payload)
+            for b in raw_buffers:
+                f.write(b)
+        os.replace(tmp_path, self.snapshot_path)
+
+
+def load_storage_namespace(script_path=None):
+    """
+    Compatibility loader: returns the same names Data_storage_Lib.py defines.
+    Reads the memory-mapped columnar store when its snapshot's content hash matches the
+    script and update log; otherwise executes the script once and rebuilds the store for
+    the next reader.
+    """
+    store = ColumnarDataStore(script_path)
+    source_hash = store.snapshot().source_hash()
+    try:
+        ns = store.load_namespace(source_hash)
+    except (OSError, ValueError) as e:
+        print(f"Columnar store unreadable ({e}), rebuilding from source.")
+        ns = None
+    if ns is None:
+        ns = exec_storage_script(store.script_path)
+        try:
+            store.write_namespace(ns, source_hash)
+        except OSError as e:
+            print(f"Could not update columnar store: {e}")
+    return ns
+
+
+# ---------- lazy, section-indexed loading ----------
+TOP_LEVEL_TARGET = re.compile(rb"^([A-Za-z_]\w*)\s*(\[.*?\])?\s*=(?!=)")
+_SECTION_INDEX_CACHE = {}
+
+
+class StorageSectionIndex:
+    """
+    Byte offsets of every top-level statement in Data_storage_Lib.py, grouped by the
+    variable it assigns. `graph_plot_info = {}` and every `graph_plot_info[...] = ...`
+    line end up in the same section, in file order.
+    Built with a plain line scan, so no Python source is parsed or executed.
+    """
+
+    def __init__(self, script_path):
+        self.script_path = script_path
+        self.mtime_ns = os.stat(script_path).st_mtime_ns
+        self.sections = {}  # variable name -> list of (start, end) byte offsets
+        self.preamble = []  # statements that do not assign a variable (imports etc.)
+        self._build()
+
+    def _build(self):
+        starts = []
+        offset = 0
+        with open(self.script_path, "rb") as f:
+            for line in f:
+                first = line[:1]
+                # A statement starts at column 0; indented lines and closing brackets continue the previous one
+                if first and not first.isspace() and first not in b"#)]}":
+                    match = TOP_LEVEL_TARGET.match(line)
+                    starts.append((offset, match.group(1).decode() if match else None))
+                offset += len(line)
+        for i, (start, name) in enumerate(starts):
+            end = starts[i + 1][0] if i + 1 < len(starts) else offset
+            if name is None:
+                self.preamble.append((start, end))
+            else:
+                self.sections.setdefault(name, []).append((start, end))
+
+
+def get_section_index(script_path):
+    """
+    Returns the section index for script_path, reusing the cached one until the file's mtime changes.
+    """
+    script_path = os.path.abspath(script_path)
+    cached = _SECTION_INDEX_CACHE.get(script_path)
+    if cached is None or cached.mtime_ns != os.stat(script_path).st_mtime_ns:
+        cached = StorageSectionIndex(script_path)
+        _SECTION_INDEX_CACHE[script_path] = cached
+    return cached
+
+
+class LazyStorageNamespace(dict):
+    """
+    Dict (and attribute) view of Data_storage_Lib.py that only executes the sections
+    of the variables a caller actually asks for, on first access:
+
+        ds = LazyStorageNamespace()
+        ds['total_percent_list']   # runs one line, not the 1,700 graph_plot_info lines
+        ds.predict_dict            # attribute access works like the imported module
+    """
+
+    def __init__(self, script_path=None):
+        super().__init__()
+        self.script_path = os.path.abspath(script_path or os.path.join(os.getcwd(), "Data_storage_Lib.py"))
+        self.index = get_section_index(self.script_path)
+        self.update_log = StorageUpdateLog(self.script_path)
+        self._log_records = None
+        self._globals = {"__builtins__": __builtins__}
+        self._loading = set()
+        self._preamble_loaded = False
+
+    def _run(self, spans):
+        chunks = []
+        with open(self.script_path, "rb") as f:
+            for start, end in spans:
+                f.seek(start)
+                chunks.append(f.read(end - start))
+        # Names referenced by the section (e.g. list_percent_call_all) resolve through __missing__
+        exec(compile(b"".join(chunks), self.script_path, "exec"), self._globals, self)
+
+    def _load_all(self):
+        with open(self.script_path, "rb") as f:
+            exec(compile(f.read(), self.script_path, "exec"), self._globals, self)
+
+    def _logged_records(self):
+        if self._log_records is None:
+            self._log_records = self.update_log.read_records()
+        return self._log_records
+
+    def _logged_names(self):
+        return {StorageUpdateLog.record_target(op, name) for op, name, _ in self._logged_records()}
+
+    def __missing__(self, name):
+        spans = self.index.sections.get(name)
+        if (spans is None and name not in self._logged_names()) or name in self._loading:
+            raise KeyError(name)
+        self._loading.add(name)
+        try:
+            if not self._preamble_loaded:
+                self._preamble_loaded = True
+                self._run(self.index.preamble)
+            if spans:
+                self._run(spans)
+        except SyntaxError:
+            # The line scan split a statement it did not understand; fall back to the whole file
+            self._load_all()
+        finally:
+            self._loading.discard(name)
+        # Pending update-log records win over the script
+        for op, record_name, value in self._logged_records():
+            if StorageUpdateLog.record_target(op, record_name) == name:
+                StorageUpdateLog.apply(self, op, record_name, value)
+        # Same shape as exec_storage_script (also after a whole-file fallback load)
+        if dict.__contains__(self, "position_counts"):
+            dict.__setitem__(self, "position_counts", position_counts_array(dict.__getitem__(self, "position_counts")))
+        return dict.__getitem__(self, name)
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or name in self.index.sections or name in self._logged_names()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def load(self, *names):
+        """
+        Materialises the given variables and returns them as a plain dict.
+        """
+        return {name: self[name] for name in names}
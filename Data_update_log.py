@@ -0,0 +1,161 @@
+import os
+import ast
+import json
+
+DEFAULT_COMPACT_THRESHOLD = 64 * 1024  # bytes of log before it is folded into the script
+
+
+class StorageUpdateLog:
+    """
+    Append-only update log sitting next to Data_storage_Lib.py (Data_storage_Lib.updates.jsonl).
+
+    Stages append small records instead of rewriting the whole script:
+      - {"op": "graph", "name": date, "value": repr(points)}    -> graph_plot_info[date] = points
+      - {"op": "predict", "value": repr(predict_dict)}           -> predict_dict = {...}
+    Plain variables are not logged; BackendScriptWriter splices them into the script directly.
+    Readers replay the records over the script (the compacted base). Once the log passes
+    `compact_threshold` bytes it is folded into the script and removed.
+    Values are stored as Python literals so tuples survive the round trip.
+    """
+
+    def __init__(self, script_path=None, compact_threshold=DEFAULT_COMPACT_THRESHOLD):
+        self.script_path = os.path.abspath(script_path or os.path.join(os.getcwd(), "Data_storage_Lib.py"))
+        self.log_path = os.path.splitext(self.script_path)[0] + ".updates.jsonl"
+        self.compact_threshold = compact_threshold
+
+    # ---------- writing ----------
+    def append_records(self, records):
+        """
+        Appends records in one write and compacts when the log grew past the threshold.
+        """
+        if not records:
+            return
+        lines = "".join(json.dumps(record) + "\n" for record in records)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        if self.compact_threshold is not None and self.size() > self.compact_threshold:
+            self.compact()
+
+    def rewrite_records(self, records):
+        """
+        Replaces the whole log with `records` through a temp file and os.replace, so a crash
+        leaves either the old or the new log; an empty list removes the log.
+        """
+        if not records:
+            if os.path.exists(self.log_path):
+                os.remove(self.log_path)
+            return
+        tmp_path = self.log_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.log_path)
+
+    def append_graph_entries(self, entries):
+        self.append_records([{"op": "graph", "name": key, "value": repr(value)} for key, value in entries.items()])
+
+    def replace_predictions(self, predict_dict):
+        self.append_records([{"op": "predict", "value": repr(predict_dict)}])
+
+    # ---------- reading ----------
+    def size(self):
+        return os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+
+    def stamp(self):
+        """
+        (mtime_ns, size) of the log, or None when there is no log; used in cache keys.
+        """
+        if not os.path.exists(self.log_path):
+            return None
+        stat = os.stat(self.log_path)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def read_records(self):
+        """
+        Returns the records as (op, name, value) tuples in append order.
+        A torn last line (crash while appending) is ignored.
+        """
+        records = []
+        if not os.path.exists(self.log_path):
+            return records
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    records.append((record["op"], record.get("name"), ast.literal_eval(record["value"])))
+                except (ValueError, KeyError, SyntaxError):
+                    print(f"Skipping unreadable update log line: {line.strip()[:80]}")
+        return records
+
+    @staticmethod
+    def record_target(op, name):
+        """
+        The top-level variable a record changes.
+        """
+        if op == "graph":
+            return "graph_plot_info"
+        if op == "predict":
+            return "predict_dict"
+        return name
+
+    @staticmethod
+    def apply(ns, op, name, value):
+        if op == "graph":
+            if "graph_plot_info" not in ns:
+                ns["graph_plot_info"] = {}
+            ns["graph_plot_info"][name] = value
+        elif op == "predict":
+            ns["predict_dict"] = value
+
+    def replay(self, ns, names=None):
+        """
+        Applies the logged records to a namespace dict, optionally only those touching `names`.
+        """
+        for op, name, value in self.read_records():
+            if names is None or self.record_target(op, name) in names:
+                self.apply(ns, op, name, value)
+        return ns
+
+    # ---------- compaction ----------
+    def compact(self):
+        """
+        Folds the log into Data_storage_Lib.py and removes it:
+          - graph records are appended as graph_plot_info[...] lines,
+          - the last predict record replaces the predict_dict line.
+        Every record is idempotent, so a crash before the log is removed only replays it again.
+        """
+        from Scripwriter import BackendScriptWriter
+        from Data_store import get_section_index
+
+        records = self.read_records()
+        if not records:
+            return
+        graph_entries, predict_dict = {}, None
+        for op, name, value in records:
+            if op == "graph":
+                graph_entries[name] = value
+            elif op == "predict":
+                predict_dict = value
+
+        writer = BackendScriptWriter()
+        sections = get_section_index(self.script_path).sections
+
+        with open(self.script_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += "\n"
+        if predict_dict is not None:
+            lines = [line for line in lines
+                     if "predict_dict" not in line and line.strip() != "# Updated predictions dictionary"]
+            lines.append("\n# Updated predictions dictionary\n")
+            lines.append("predict_dict = " + repr(predict_dict) + "\n")
+        if graph_entries and "graph_plot_info" not in sections:
+            lines.append("graph_plot_info = {}\n")
+        lines += [f"graph_plot_info[{repr(key)}] = {value}\n" for key, value in graph_entries.items()]
+        writer.atomic_write(self.script_path, "".join(lines))
+
+        os.remove(self.log_path)
+        print(f"✅ Compacted {len(records)} logged updates into {self.script_path}")
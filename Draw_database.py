@@ -0,0 +1,306 @@
+import os
+import sqlite3
+import openpyxl
+from openpyxl.packaging.custom import IntProperty
+
+HEADERS = ["Draw no.", "Date", "no1", "no2", "no3", "no4", "no5", "no6", "Addict. no"]
+SYNC_PROPERTY = "last_synced_draw"  # custom document property holding the newest exported draw no.
+
+
+class DrawDatabase:
+    """
+    SQLite store holding the canonical draw history (database_analysis.xlsx is exported from it).
+
+    Tables:
+      - draws        : draw_no (primary key), draw_date (ISO, indexed), n1..n6, addl
+      - draw_numbers : (number, draw_no) pairs, so "draws containing k" is an index lookup
+      - absent_draws : draw numbers the website was checked for and does not list, so gap
+                       detection does not request them again
+      - failed_ranges: draw-number spans of pages that could not be fetched, kept until every
+                       number in them is stored or known absent, so later runs request them again
+    """
+
+    def __init__(self, db_path="database_analysis.sqlite"):
+        self.db_path = os.path.abspath(db_path)
+        self.conn = sqlite3.connect(self.db_path)
+        self.create_tables()
+
+    def create_tables(self):
+        with self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS draws (
+                    draw_no   INTEGER PRIMARY KEY,
+                    draw_date TEXT NOT NULL,
+                    n1 INTEGER, n2 INTEGER, n3 INTEGER, n4 INTEGER, n5 INTEGER, n6 INTEGER,
+                    addl INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS idx_draws_date ON draws (draw_date);
+                CREATE TABLE IF NOT EXISTS draw_numbers (
+                    number        INTEGER NOT NULL,
+                    draw_no       INTEGER NOT NULL,
+                    is_additional INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (number, draw_no)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS absent_draws (
+                    draw_no INTEGER PRIMARY KEY
+                );
+                CREATE TABLE IF NOT EXISTS failed_ranges (
+                    first_draw INTEGER NOT NULL,
+                    last_draw  INTEGER NOT NULL,
+                    PRIMARY KEY (first_draw, last_draw)
+                ) WITHOUT ROWID;
+            """)
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def to_row(draw_info):
+        """
+        Converts a fetcher draw dict ({"draw", "date", "winning_numbers", "addl"}) into a table row.
+        """
+        numbers = [int(float(n)) for n in draw_info["winning_numbers"][:6]]
+        numbers += [None] * (6 - len(numbers))
+        addl = draw_info.get("addl")
+        addl = int(float(addl)) if addl not in (None, "") else None
+        return (int(draw_info["draw"]), str(draw_info["date"])[:10], *numbers, addl)
+
+    def upsert_rows(self, rows):
+        """
+        Bulk insert/update of (draw_no, date, n1..n6, addl) rows in one transaction.
+        Returns the number of rows that were inserted or actually changed.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        before = self.conn.total_changes
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO draws (draw_no, draw_date, n1, n2, n3, n4, n5, n6, addl)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(draw_no) DO UPDATE SET
+                    draw_date = excluded.draw_date,
+                    n1 = excluded.n1, n2 = excluded.n2, n3 = excluded.n3,
+                    n4 = excluded.n4, n5 = excluded.n5, n6 = excluded.n6,
+                    addl = excluded.addl
+                WHERE (draws.draw_date, draws.n1, draws.n2, draws.n3, draws.n4, draws.n5, draws.n6, draws.addl)
+                   IS NOT (excluded.draw_date, excluded.n1, excluded.n2, excluded.n3,
+                           excluded.n4, excluded.n5, excluded.n6, excluded.addl)
+            """, rows)
+            changed = self.conn.total_changes - before
+            if changed:
+                draw_nos = [(row[0],) for row in rows]
+                self.conn.executemany("DELETE FROM draw_numbers WHERE draw_no = ?", draw_nos)
+                number_rows = []
+                for row in rows:
+                    number_rows += [(n, row[0], 0) for n in row[2:8] if n is not None]
+                    if row[8] is not None and row[8] not in row[2:8]:
+                        number_rows.append((row[8], row[0], 1))
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO draw_numbers (number, draw_no, is_additional) VALUES (?, ?, ?)",
+                    number_rows,
+                )
+        return changed
+
+    def upsert_draws(self, all_draws):
+        """
+        Bulk upsert of fetcher draw dicts ({"draw", "date", "winning_numbers", "addl"}).
+        """
+        return self.upsert_rows(self.to_row(draw_info) for draw_info in all_draws)
+
+    def import_xlsx(self, workbook_path, sheet_name="Data"):
+        """
+        Loads an existing database_analysis.xlsx into the database (used to bootstrap it).
+        """
+        wb = openpyxl.load_workbook(workbook_path, read_only=True)
+        ws = wb[sheet_name] if sheet_name in wb.sheetnames else wb.active
+        rows = []
+        for row in ws.iter_rows(min_row=2, max_col=9, values_only=True):
+            if row[0] is None:
+                continue
+            rows.append(self.to_row({
+                "draw": row[0], "date": row[1], "winning_numbers": list(row[2:8]), "addl": row[8],
+            }))
+        wb.close()
+        changed = self.upsert_rows(rows)
+        print(f"Imported {len(rows)} draws from {workbook_path} ({changed} new/changed).")
+        return changed
+
+    def export_xlsx(self, workbook_path, sheet_name="Data"):
+        """
+        Writes the whole history (newest draw first, same layout as before) to the workbook,
+        streaming the rows in write-only mode, and stamps it with the last synced draw number.
+        """
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
+        ws.append(HEADERS)
+        for row in self.conn.execute("SELECT * FROM draws ORDER BY draw_no DESC"):
+            ws.append(row)
+        latest = self.latest_draw_no()
+        if latest is not None:
+            wb.custom_doc_props.append(IntProperty(name=SYNC_PROPERTY, value=latest))
+        self.save_workbook(wb, workbook_path)
+        print(f"Exported {self.count()} draws to {workbook_path}")
+
+    @staticmethod
+    def save_workbook(wb, workbook_path):
+        """
+        Saves through a temporary file so an interrupted save never leaves a truncated workbook.
+        """
+        workbook_path = os.path.abspath(workbook_path)
+        tmp_path = os.path.splitext(workbook_path)[0] + ".tmp.xlsx"
+        wb.save(tmp_path)
+        os.replace(tmp_path, workbook_path)
+
+    @staticmethod
+    def read_synced_draw_no(workbook_path):
+        """
+        The last synced draw number stored in the workbook's custom properties, or None when the
+        workbook is missing or was not written by sync_xlsx/export_xlsx. No sheet data is read.
+        """
+        if not os.path.exists(workbook_path):
+            return None
+        wb = openpyxl.load_workbook(workbook_path, read_only=True)
+        try:
+            prop = wb.custom_doc_props[SYNC_PROPERTY] if SYNC_PROPERTY in wb.custom_doc_props.names else None
+            return int(prop.value) if prop is not None else None
+        finally:
+            wb.close()
+
+    def sync_xlsx(self, workbook_path, sheet_name="Data", rebuild=False):
+        """
+        Brings the workbook up to date with the database. Draws newer than the workbook's last synced
+        draw number are inserted under the header (the sheet stays newest first) and the marker is
+        advanced. The workbook is rebuilt with export_xlsx when it is missing, has no marker or
+        sheet, or when rebuild=True (stored draws were corrected). Returns the number of rows written.
+        """
+        synced = None if rebuild else self.read_synced_draw_no(workbook_path)
+        if synced is None:
+            self.export_xlsx(workbook_path, sheet_name)
+            return self.count()
+        new_rows = self.draws_since(synced)
+        if not new_rows:
+            print(f"{workbook_path} already holds every draw up to {synced}.")
+            return 0
+        wb = openpyxl.load_workbook(workbook_path)
+        if sheet_name not in wb.sheetnames:
+            wb.close()
+            self.export_xlsx(workbook_path, sheet_name)
+            return self.count()
+        ws = wb[sheet_name]
+        ws.insert_rows(2, len(new_rows))
+        for offset, row in enumerate(reversed(new_rows)):
+            for column, value in enumerate(row, start=1):
+                ws.cell(row=2 + offset, column=column, value=value)
+        wb.custom_doc_props[SYNC_PROPERTY].value = new_rows[-1][0]
+        self.save_workbook(wb, workbook_path)
+        print(f"Inserted {len(new_rows)} new draws into {workbook_path} (synced to {new_rows[-1][0]}).")
+        return len(new_rows)
+
+    # ---------- queries ----------
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM draws").fetchone()[0]
+
+    def latest_draw_no(self):
+        """
+        Highest draw number held, or None when the database is empty.
+        """
+        return self.conn.execute("SELECT MAX(draw_no) FROM draws").fetchone()[0]
+
+    def all_draws(self):
+        """
+        Every draw as (draw_no, date, n1..n6, addl), oldest first.
+        """
+        return self.conn.execute("SELECT * FROM draws ORDER BY draw_no").fetchall()
+
+    def draws_since(self, draw_no):
+        """
+        Draws with a draw number greater than draw_no, oldest first.
+        """
+        return self.conn.execute(
+            "SELECT * FROM draws WHERE draw_no > ? ORDER BY draw_no", (draw_no,)
+        ).fetchall()
+
+    def draws_between(self, start_date, end_date):
+        """
+        Draws whose ISO date lies in [start_date, end_date], oldest first.
+        """
+        return self.conn.execute(
+            "SELECT * FROM draws WHERE draw_date BETWEEN ? AND ? ORDER BY draw_no",
+            (str(start_date)[:10], str(end_date)[:10]),
+        ).fetchall()
+
+    def missing_ranges(self):
+        """
+        Holes in the stored draw-number sequence as inclusive (first, last) ranges, lowest first:
+        the gaps between the oldest and the newest stored draw, plus the numbers of recorded
+        failed ranges (which may lie before the oldest stored draw) not stored yet.
+        Numbers recorded in absent_draws are not holes.
+        """
+        holes = self.conn.execute("""
+            SELECT draw_no + 1, next_no - 1 FROM (
+                SELECT draw_no, LEAD(draw_no) OVER (ORDER BY draw_no) AS next_no FROM (
+                    SELECT draw_no FROM draws UNION SELECT draw_no FROM absent_draws
+                )
+            ) WHERE next_no - draw_no > 1 ORDER BY draw_no
+        """).fetchall()
+        for first, last in self.conn.execute("SELECT first_draw, last_draw FROM failed_ranges").fetchall():
+            covered = {row[0] for row in self.conn.execute(
+                "SELECT draw_no FROM draws WHERE draw_no BETWEEN ? AND ? "
+                "UNION SELECT draw_no FROM absent_draws WHERE draw_no BETWEEN ? AND ?", (first, last, first, last))}
+            start = None
+            for draw_no in range(first, last + 2):
+                if draw_no <= last and draw_no not in covered:
+                    start = draw_no if start is None else start
+                elif start is not None:
+                    holes.append((start, draw_no - 1))
+                    start = None
+        merged = []
+        for first, last in sorted(holes):
+            if merged and first <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(last, merged[-1][1]))
+            else:
+                merged.append((first, last))
+        return merged
+
+    def record_failed_ranges(self, ranges):
+        """
+        Remembers draw-number spans (first, last) of pages that could not be fetched.
+        """
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO failed_ranges (first_draw, last_draw) VALUES (?, ?)",
+                                  [(int(first), int(last)) for first, last in ranges if first <= last])
+
+    def resolve_failed_ranges(self):
+        """
+        Forgets the failed ranges whose numbers are now all stored or known absent.
+        Returns the number of ranges still open.
+        """
+        with self.conn:
+            self.conn.execute("""
+                DELETE FROM failed_ranges WHERE last_draw - first_draw + 1 = (
+                    SELECT COUNT(*) FROM (
+                        SELECT draw_no FROM draws WHERE draw_no BETWEEN first_draw AND last_draw
+                        UNION SELECT draw_no FROM absent_draws WHERE draw_no BETWEEN first_draw AND last_draw
+                    )
+                )
+            """)
+        return self.conn.execute("SELECT COUNT(*) FROM failed_ranges").fetchone()[0]
+
+    def mark_absent(self, draw_nos):
+        """
+        Records draw numbers that the website does not list.
+        """
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO absent_draws (draw_no) VALUES (?)",
+                                  [(draw_no,) for draw_no in draw_nos])
+
+    def draws_containing(self, number, include_additional=False):
+        """
+        Draws in which `number` was drawn (optionally also as the additional number), oldest first.
+        """
+        query = """
+            SELECT d.* FROM draw_numbers AS x JOIN draws AS d ON d.draw_no = x.draw_no
+            WHERE x.number = ?{extra} ORDER BY d.draw_no
+        """.format(extra="" if include_additional else " AND x.is_additional = 0")
+        return self.conn.execute(query, (number,)).fetchall()
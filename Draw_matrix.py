@@ -0,0 +1,105 @@
+import os
+import numpy as np
+import openpyxl
+
+NUMBER_COLUMNS = "CDEFGHI"  # no1..no6 and the additional number
+DRAW_COLUMN = "A"
+DATE_COLUMN = "B"
+
+
+class DrawMatrix:
+    """
+    The Data sheet of database_analysis.xlsx read once, in sheet order (newest draw first):
+      - numbers  : int16 (N, 7), columns C..I (0 where a cell is empty)
+      - draw_nos : int32 (N,)
+      - dates    : datetime64[D] (N,)
+      - headers  : the header row, A..I
+    Use DrawMatrix.get(path, sheet), which reuses the matrix until the workbook's mtime or size
+    changes, so every consumer in a run shares one scan of the sheet.
+    """
+    _cache = {}
+
+    def __init__(self, workbook_path, sheet_name="Data"):
+        self.workbook_path = workbook_path
+        self.sheet_name = sheet_name
+        stat = os.stat(workbook_path)
+        self.stamp = (stat.st_mtime_ns, stat.st_size)
+        wb = openpyxl.load_workbook(workbook_path, read_only=True)
+        try:
+            ws = wb[sheet_name] if sheet_name in wb.sheetnames else wb.active
+            rows = ws.iter_rows(max_col=9, values_only=True)
+            header = next(rows, None) or ()
+            self.headers = [str(h) if h is not None else "" for h in header] + [""] * (9 - len(header))
+            draw_nos, dates, numbers = [], [], []
+            for row in rows:
+                if row[0] is None:
+                    continue
+                row = tuple(row) + (None,) * (9 - len(row))
+                draw_nos.append(int(float(row[0])))
+                dates.append(str(row[1])[:10])
+                numbers.append([int(float(v)) if v not in (None, "") else 0 for v in row[2:9]])
+        finally:
+            wb.close()
+        self.draw_nos = np.asarray(draw_nos, dtype=np.int32)
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.numbers = np.asarray(numbers, dtype=np.int16).reshape(-1, 7)
+
+    @classmethod
+    def get(cls, workbook_path="database_analysis.xlsx", sheet_name="Data"):
+        workbook_path = os.path.abspath(workbook_path)
+        stat = os.stat(workbook_path)
+        key = (workbook_path, sheet_name)
+        matrix = cls._cache.get(key)
+        if matrix is None or matrix.stamp != (stat.st_mtime_ns, stat.st_size):
+            matrix = cls(workbook_path, sheet_name)
+            cls._cache[key] = matrix
+        return matrix
+
+    def __len__(self):
+        return len(self.draw_nos)
+
+    def column(self, column_letter):
+        """
+        One number column (C..I) as an int16 array, empty cells dropped, sheet order.
+        """
+        values = self.numbers[:, NUMBER_COLUMNS.index(column_letter.upper())]
+        return values[values > 0]
+
+    def get_value_in_column(self, column_letter):
+        """
+        Same result as excel_functions.get_value_in_column: every value, sorted.
+        """
+        return np.sort(self.column(column_letter)).tolist()
+
+    def count_column_values(self, column_letter):
+        """
+        Same result as excel_functions.count_column_values: the distinct values, sorted.
+        """
+        return np.unique(self.column(column_letter)).tolist()
+
+    def table(self, start_col, end_col):
+        """
+        Header names and rows (draw no. as int, date as ISO text, numbers as ints) for the
+        columns start_col..end_col within A..I, as read_excel would have produced them.
+        """
+        letters = DRAW_COLUMN + DATE_COLUMN + NUMBER_COLUMNS
+        first, last = letters.index(start_col.upper()), letters.index(end_col.upper())
+        columns = [self.draw_nos.tolist(), np.datetime_as_string(self.dates).tolist()]
+        columns += [self.numbers[:, i].tolist() for i in range(7)]
+        return self.headers[first:last + 1], [list(row) for row in zip(*columns[first:last + 1])]
+
+
+def draw_matrix_column(workbook_path, sheet_name, column_letter, distinct=False):
+    """
+    A number column served from the shared DrawMatrix, or None when the column is not one of
+    C..I or the workbook cannot be read (callers then fall back to reading the sheet themselves).
+    """
+    if column_letter.upper() not in NUMBER_COLUMNS:
+        return None
+    try:
+        matrix = DrawMatrix.get(workbook_path, sheet_name)
+    except (OSError, ValueError, KeyError):
+        return None
+    if distinct:
+        return matrix.count_column_values(column_letter)
+    return matrix.get_value_in_column(column_letter)
@@ -1,7 +1,20 @@
 import os
-import win32com.client
+try:
+    import win32com.client
+except ImportError:  # not on Windows / pywin32 missing: the openpyxl backend is used instead
+    win32com = None
 import openpyxl
 import time
+from Draw_matrix import draw_matrix_column
+
+
+class ExcelUnavailableError(RuntimeError):
+    """
+    Raised for operations that need a running Excel over win32com (e.g. VBA macros)
+    when the openpyxl backend is in use.
+    """
+
+
 class excel_functions:
 
     def __init__(self):
@@ -47,6 +60,10 @@ class excel_functions:
         
     
     def count_column_values(self, sheet_name, column_letter):
+        column_values = draw_matrix_column(self.workbook_path, sheet_name, column_letter, distinct=True)
+        if column_values is not None:
+            print(column_values)
+            return column_values
         sheet = self.workbook.Sheets(sheet_name)
         column_values = []
         for row in range(2, sheet.UsedRange.Rows.Count + 1):
@@ -88,7 +105,10 @@ class excel_functions:
         print(column_values)
     
     def get_value_in_column(self, sheet_name, column_letter):
-        
+        column_values = draw_matrix_column(self.workbook_path, sheet_name, column_letter)
+        if column_values is not None:
+            print(column_values)
+            return column_values
         sheet = self.workbook.Sheets(sheet_name)
         column_values = []
         for row in range(2, sheet.UsedRange.Rows.Count + 1):
@@ -134,4 +154,94 @@ class excel_functions:
     
         
     
-    
\ No newline at end of file
+    
+
+
+class openpyxl_excel_functions:
+    """
+    Pure-Python stand-in for excel_functions with the same method surface, for hosts without
+    Excel/COM. The workbook is opened with openpyxl in read-only mode and every column read is
+    one streamed values_only pass instead of a COM round-trip per cell. run_macro raises
+    ExcelUnavailableError: macros need Excel.
+    """
+
+    def __init__(self, workbook_name='database_analysis.xlsx'):
+        self.workbook_name = workbook_name
+        self.workbook_path = os.path.join(os.getcwd(), self.workbook_name)
+        self.workbook = openpyxl.load_workbook(self.workbook_path, read_only=True, data_only=True)
+        self.sheet = self.workbook.active
+
+    def open_function(self):
+        print("Opening workbook (openpyxl, read-only)...")
+        print("Workbook opened.")
+
+    def close_function(self):
+        self.workbook.close()
+        print("Workbook closed.")
+
+    def save_function(self):
+        # read-only backend: nothing is modified, so there is nothing to save
+        self.close_function()
+
+    def run_macro(self, macro_name):
+        raise ExcelUnavailableError(f"Macro '{macro_name}' needs Excel over win32com (Windows with pywin32); "
+                                    "the openpyxl backend cannot run macros.")
+
+    def column_cells(self, sheet_name, column_letter, min_row=2):
+        """
+        Non-empty values of one column from min_row down, in sheet order.
+        """
+        column = openpyxl.utils.column_index_from_string(column_letter)
+        sheet = self.workbook[sheet_name]
+        return [row[0] for row in sheet.iter_rows(min_row=min_row, min_col=column, max_col=column, values_only=True)
+                if row[0] is not None]
+
+    def count_column_values(self, sheet_name, column_letter):
+        column_values = draw_matrix_column(self.workbook_path, sheet_name, column_letter, distinct=True)
+        if column_values is None:
+            column_values = list(set(sorted(int(float(value)) for value in self.column_cells(sheet_name, column_letter))))
+        print(column_values)
+        return column_values
+
+    def count_column_values_range(self, sheet_name, cell_range):
+        sheet = self.workbook[sheet_name]
+        column_values = [str(cell.value).replace(',', '') for row in sheet[cell_range] for cell in row
+                         if cell.value is not None]
+        column_values = list(set(column_values))
+        print(column_values)
+
+    def get_value_in_column(self, sheet_name, column_letter):
+        column_values = draw_matrix_column(self.workbook_path, sheet_name, column_letter)
+        if column_values is None:
+            column_values = list(sorted(int(float(value)) for value in self.column_cells(sheet_name, column_letter)))
+        print(column_values)
+        return column_values
+
+    def detect_function(self, sheet_name, range_row, column_range):
+        sheet = self.workbook[sheet_name]
+        start_column = openpyxl.utils.column_index_from_string(column_range[0])
+        end_column = openpyxl.utils.column_index_from_string(column_range[2])
+        data = []
+        for i, row in enumerate(sheet.iter_rows(min_row=range_row, min_col=start_column, max_col=end_column,
+                                                values_only=True)):
+            if i % 3:
+                continue
+            values = [value for value in row if value is not None]
+            if not values:
+                break
+            data += values
+            print(data)
+        return data
+
+
+def get_excel_functions(prefer_com=True):
+    """
+    excel_functions (Excel over COM) when win32com is available and Excel starts,
+    otherwise the openpyxl backend.
+    """
+    if prefer_com and win32com is not None:
+        try:
+            return excel_functions()
+        except Exception as e:
+            print("Excel over COM unavailable, using openpyxl backend:", e)
+    return openpyxl_excel_functions()
\ No newline at end of file
@@ -0,0 +1,143 @@
+import time
+import random
+import asyncio
+from collections import namedtuple
+import aiohttp
+
+FetchResult = namedtuple("FetchResult", ["status", "text", "headers"])
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/98.0.4758.102 Safari/537.36"
+    )
+}
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter: `rate` requests per second on average, bursts up to `capacity`.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class FetchEngine:
+    """
+    Shared HTTP client for the scraper:
+      - one aiohttp session with a per-host connection limit and keep-alive reuse,
+      - a token-bucket rate limiter in front of every request,
+      - retries with jittered exponential backoff on 429/5xx, timeouts and connection errors
+        (a Retry-After header is honoured),
+      - per-key retry accounting in `self.stats`.
+
+        async with FetchEngine(limit_per_host=4, rate=5) as engine:
+            result = await engine.fetch(url, key=page)
+    """
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, limit_per_host=4, rate=5.0, burst=5, timeout=15, connect_timeout=5,
+                 max_retries=4, backoff_base=0.5, backoff_max=30.0, keepalive_timeout=30, headers=None):
+        self.limit_per_host = limit_per_host
+        self.bucket = TokenBucket(rate, burst)
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.keepalive_timeout = keepalive_timeout
+        self.headers = dict(DEFAULT_HEADERS, **(headers or {}))
+        self.session = None
+        self.stats = {}  # key -> {"attempts": n, "status": last status, "error": last error, "resolved": reason}
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit_per_host=self.limit_per_host, keepalive_timeout=self.keepalive_timeout)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout, headers=self.headers)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.session.close()
+
+    def backoff_delay(self, attempt, retry_after=None):
+        """
+        Exponential backoff with jitter (between half and the full step), capped at backoff_max.
+        """
+        if retry_after is not None:
+            return min(self.backoff_max, retry_after)
+        step = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return step / 2 + random.uniform(0, step / 2)
+
+    @staticmethod
+    def parse_retry_after(headers):
+        try:
+            return float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            return None
+
+    async def fetch(self, url, key=None, headers=None):
+        """
+        GETs url, retrying transient failures. Returns a FetchResult for any final status
+        (200, 304, 404, ...) or None once the retries are exhausted.
+        """
+        key = url if key is None else key
+        record = self.stats.setdefault(key, {"attempts": 0, "status": None, "error": None, "resolved": None})
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire()
+            record["attempts"] += 1
+            retry_after = None
+            try:
+                async with self.session.get(url, headers=headers) as resp:
+                    record["status"] = resp.status
+                    if resp.status not in self.RETRY_STATUSES:
+                        text = await resp.text() if resp.status == 200 else ""
+                        record["error"] = record["resolved"] = None
+                        return FetchResult(resp.status, text, resp.headers)
+                    retry_after = self.parse_retry_after(resp.headers)
+                    record["error"] = f"HTTP {resp.status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                record["error"] = f"{type(e).__name__}: {e}"
+            if attempt < self.max_retries:
+                delay = self.backoff_delay(attempt, retry_after)
+                print(f"Retrying {key} in {delay:.1f}s ({record['error']})")
+                await asyncio.sleep(delay)
+        print(f"Giving up on {key} after {record['attempts']} attempts ({record['error']})")
+        return None
+
+    def mark_resolved(self, key, reason):
+        """
+        Notes that a failed key no longer matters (its data was fetched another way, or it was
+        superseded). The record and its attempts stay in the accounting.
+        """
+        record = self.stats.get(key)
+        if record is not None and record["error"] is not None:
+            record["resolved"] = reason
+
+    def failed_keys(self):
+        """
+        Keys whose last attempt did not end with a usable response and that were not resolved.
+        """
+        return sorted(key for key, record in self.stats.items()
+                      if record["error"] is not None and not record["resolved"])
+
+    def retry_summary(self):
+        retried = {key: record["attempts"] for key, record in self.stats.items() if record["attempts"] > 1}
+        resolved = {key: record["resolved"] for key, record in self.stats.items()
+                    if record["error"] is not None and record["resolved"]}
+        return {"requests": sum(r["attempts"] for r in self.stats.values()), "retried": retried,
+                "failed": self.failed_keys(), "resolved": resolved}
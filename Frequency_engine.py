@@ -0,0 +1,299 @@
+import os
+import re
+import hashlib
+import datetime
+from collections import namedtuple
+import numpy as np
+
+DEFAULT_WINDOWS = (None, 50, 100, 500)  # None = all-time
+POSITIONS = 7  # no1..no6 and the additional number (columns C..I)
+VALUES = 50    # ball values 1..49; index 0 holds empty cells and is never reported
+OFFSETS = (np.arange(POSITIONS) * VALUES).astype(np.int16)  # codes stay < 350, so int16 is enough
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+class PositionFrequencies(namedtuple("PositionFrequencies", ["counts", "totals"])):
+    """
+    Per-position histograms of the draw history.
+      counts : int64 (7, 50), counts[p, v] = draws with value v at position p (C..I)
+      totals : int64 (7,), non-empty cells per position (the percentage denominator)
+    list_percent*, list_highest* and list_lowest* in Data_storage_Lib are derived from it.
+    """
+
+    def percentages(self):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.totals[:, None] > 0, self.counts * 100.0 / self.totals[:, None], 0.0)
+
+    def present_values(self, position):
+        return np.flatnonzero(self.counts[position, 1:]) + 1
+
+    def percent(self, position, value):
+        """
+        Same arithmetic as the old dict loop, (count / total) * 100, as a Python float.
+        """
+        return (int(self.counts[position, value]) / int(self.totals[position])) * 100
+
+    def ranked(self, position, k, highest=True):
+        """
+        k (value, percent) pairs with the highest or lowest share at a position, among values
+        that occurred. argpartition picks the k candidates; only those k are sorted. Ties go to the
+        smaller value, matching the stable sort over ascending values used before.
+        """
+        values = self.present_values(position)
+        if len(values) == 0 or k <= 0:
+            return []
+        counts = self.counts[position, values]
+        keys = (-counts if highest else counts) * VALUES + values
+        k = min(k, len(values))
+        chosen = np.argpartition(keys, k - 1)[:k] if k < len(values) else np.arange(len(values))
+        chosen = chosen[np.argsort(keys[chosen])]
+        return [(int(values[i]), self.percent(position, int(values[i]))) for i in chosen]
+
+    def top_k(self, position, k=3):
+        return self.ranked(position, k, highest=True)
+
+    def bottom_k(self, position, k=3):
+        return self.ranked(position, k, highest=False)
+
+    def percent_list(self, position):
+        """
+        The "Value X: (Y.YY%)" strings stored as list_percent1..7, ascending value order.
+        """
+        return [f"Value {value}: ({self.percent(position, int(value)):.2f}%)" for value in self.present_values(position)]
+
+    def counts_list(self):
+        """
+        counts as nested lists, the shape stored as position_counts.
+        """
+        return self.counts.tolist()
+
+
+def position_frequencies(numbers):
+    """
+    All seven histograms of an (N, 7) number matrix (0 = empty cell) in one np.bincount:
+    each column is shifted into its own block of 50 codes, so one pass counts every position.
+    """
+    numbers = np.asarray(numbers)
+    if numbers.size == 0:
+        return PositionFrequencies(np.zeros((POSITIONS, VALUES), dtype=np.int64), np.zeros(POSITIONS, dtype=np.int64))
+    codes = numbers.astype(np.int16, copy=False) + OFFSETS
+    counts = np.bincount(codes.ravel(), minlength=POSITIONS * VALUES).reshape(POSITIONS, VALUES)
+    counts[:, 0] = 0
+    return PositionFrequencies(counts, counts.sum(axis=1))
+
+
+class RollingFrequencies:
+    """
+    Per-position counts kept up to date draw by draw for several windows (all-time and the last
+    50/100/500 draws by default). Appending a draw adds its 7 values to every window and removes
+    the 7 values of the draw leaving each bounded window, read from a ring buffer of the last
+    max(window) draws, so an update costs O(7) per window whatever the history length.
+    The state is saved to data_store/rolling_frequencies.npz and reloaded on the next run,
+    together with a fingerprint (SHA-256) of the draws it has counted, so a history that was
+    corrected underneath (same draw numbers, different values) is recounted, not trusted.
+
+        rolling = RollingFrequencies.load()
+        rolling.sync(matrix.draw_nos, matrix.numbers)   # appends only the draws not seen yet
+        rolling.frequencies(100)                        # PositionFrequencies of the last 100 draws
+        rolling.save()
+    """
+
+    def __init__(self, windows=DEFAULT_WINDOWS, state_path=None):
+        self.windows = tuple(windows)
+        self.state_path = state_path or os.path.join(os.getcwd(), "data_store", "rolling_frequencies.npz")
+        self.capacity = max([w for w in self.windows if w is not None] or [1])
+        self.ring = np.zeros((self.capacity, POSITIONS), dtype=np.int16)
+        self.counts = {w: np.zeros((POSITIONS, VALUES), dtype=np.int64) for w in self.windows}
+        self.size = 0  # draws appended so far
+        self.last_draw_no = None
+        self.fingerprint = None  # history_fingerprint of the draws counted so far
+        self.rows = np.arange(POSITIONS)
+
+    @staticmethod
+    def history_fingerprint(draw_nos, numbers):
+        """
+        SHA-256 (hex) over draw numbers and values of a history, oldest draw first.
+        """
+        digest = hashlib.sha256()
+        digest.update(np.ascontiguousarray(draw_nos, dtype=np.int64).tobytes())
+        digest.update(np.ascontiguousarray(numbers, dtype=np.int16).reshape(-1, POSITIONS).tobytes())
+        return digest.hexdigest()
+
+    def append(self, draw_no, numbers):
+        """
+        Adds one draw (7 numbers, C..I order, 0 for an empty cell). The fingerprint is reset
+        (the next sync recounts) unless the caller is sync, which sets it for the whole history.
+        """
+        numbers = np.asarray(numbers, dtype=np.int16)
+        slot = self.size % self.capacity
+        for window, counts in self.counts.items():
+            if window is not None and self.size >= window:
+                counts[self.rows, self.ring[(self.size - window) % self.capacity]] -= 1
+            counts[self.rows, numbers] += 1
+        self.ring[slot] = numbers
+        self.size += 1
+        self.last_draw_no = int(draw_no)
+        self.fingerprint = None
+
+    def rebuild(self, draw_nos, numbers):
+        """
+        Recounts every window from the full history (oldest draw first) in one bincount each.
+        """
+        numbers = np.asarray(numbers, dtype=np.int16).reshape(-1, POSITIONS)
+        for window in self.windows:
+            tail = numbers if window is None else numbers[-window:]
+            self.counts[window] = position_frequencies(tail).counts.copy()
+        self.size = len(numbers)
+        self.ring[:] = 0
+        tail = numbers[-self.capacity:]
+        slots = (np.arange(self.size - len(tail), self.size)) % self.capacity
+        self.ring[slots] = tail
+        self.last_draw_no = int(draw_nos[-1]) if len(draw_nos) else None
+        self.fingerprint = self.history_fingerprint(draw_nos, numbers)
+
+    def sync(self, draw_nos, numbers):
+        """
+        Brings the state up to a history given in any order (e.g. DrawMatrix, newest first).
+        Draws newer than the last one seen are appended; if the history changed underneath
+        (fewer draws, older draws filled in, or a counted draw corrected, i.e. the fingerprint
+        of the first `size` draws differs) everything is recounted. Returns the number of draws
+        appended, or -1 after a rebuild.
+        """
+        draw_nos = np.asarray(draw_nos)
+        order = np.argsort(draw_nos, kind="stable")
+        draw_nos, numbers = draw_nos[order], np.asarray(numbers)[order]
+        consistent = (self.last_draw_no is not None and self.fingerprint is not None
+                      and 0 < self.size <= len(draw_nos)
+                      and int(draw_nos[self.size - 1]) == self.last_draw_no
+                      and self.history_fingerprint(draw_nos[:self.size], numbers[:self.size]) == self.fingerprint)
+        if not consistent:
+            self.rebuild(draw_nos, numbers)
+            return -1
+        appended = 0
+        for i in range(self.size, len(draw_nos)):
+            self.append(draw_nos[i], numbers[i])
+            appended += 1
+        self.fingerprint = self.history_fingerprint(draw_nos, numbers)
+        return appended
+
+    def frequencies(self, window=None):
+        counts = self.counts[window].copy()
+        counts[:, 0] = 0
+        return PositionFrequencies(counts, counts.sum(axis=1))
+
+    # ---------- persistence ----------
+    def save(self):
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, windows=np.array([-1 if w is None else w for w in self.windows]),
+                     counts=np.stack([self.counts[w] for w in self.windows]), ring=self.ring,
+                     size=self.size, last_draw_no=-1 if self.last_draw_no is None else self.last_draw_no,
+                     fingerprint=np.array(self.fingerprint or ""))
+        os.replace(tmp_path, self.state_path)
+
+    @classmethod
+    def load(cls, windows=DEFAULT_WINDOWS, state_path=None):
+        """
+        The saved state, or an empty one when there is none or it was saved with other windows.
+        A state saved without a fingerprint is recounted by the next sync.
+        """
+        rolling = cls(windows, state_path)
+        if not os.path.exists(rolling.state_path):
+            return rolling
+        with np.load(rolling.state_path) as state:
+            saved_windows = tuple(None if w < 0 else int(w) for w in state["windows"])
+            if saved_windows != rolling.windows or state["ring"].shape != rolling.ring.shape:
+                return rolling
+            rolling.counts = {w: state["counts"][i].copy() for i, w in enumerate(saved_windows)}
+            rolling.ring = state["ring"].copy()
+            rolling.size = int(state["size"])
+            last_draw_no = int(state["last_draw_no"])
+            rolling.last_draw_no = None if last_draw_no < 0 else last_draw_no
+            fingerprint = str(state["fingerprint"]) if "fingerprint" in state.files else ""
+            rolling.fingerprint = fingerprint or None
+        return rolling
+
+
+def build_count_cube(numbers):
+    """
+    Prefix sums of the per-position counts for an (N, 7) history, oldest draw first:
+    cube[i, p, v] = draws among the first i with value v at position p, shape (N + 1, 7, 50).
+    The all-positions variant is cube.sum(axis=1), shape (N + 1, 50).
+    """
+    numbers = np.asarray(numbers, dtype=np.int64).reshape(-1, POSITIONS)
+    cube = np.zeros((len(numbers) + 1, POSITIONS, VALUES), dtype=np.int32)
+    cube[np.arange(1, len(numbers) + 1)[:, None], np.arange(POSITIONS), numbers] = 1
+    np.cumsum(cube, axis=0, out=cube)
+    return cube
+
+
+class CountCube:
+    """
+    Frequencies over any draw range in O(1): two lookups into the prefix-sum cube and a subtraction.
+    Range ends are draw numbers (int, or a str of digits) or dates ('YYYY-MM-DD', date, datetime64) and are
+    resolved to cube rows by bisection over the sorted draw numbers / dates; both ends are
+    inclusive and None means the start or end of the history.
+
+        cube = ColumnarDataStore().read_count_cube()
+        cube.frequencies("2024-01-01", "2024-03-31").top_k(0, 3)
+        cube.frequencies(end=3900)            # as of draw 3900
+        cube.all_positions(4000, 4054)        # counts over all seven positions
+    """
+
+    def __init__(self, draw_nos, dates, cube, cube_all=None):
+        self.draw_nos = np.asarray(draw_nos)
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.cube = cube
+        self.cube_all = cube_all if cube_all is not None else np.asarray(cube).sum(axis=1)
+
+    @staticmethod
+    def is_date(bound):
+        if isinstance(bound, str):
+            return ISO_DATE.fullmatch(bound.strip()) is not None
+        return isinstance(bound, (datetime.date, np.datetime64))
+
+    def row(self, bound, end):
+        """
+        Cube row delimiting a range: for a start bound the first draw >= bound, for an end bound
+        one past the last draw <= bound. Raises ValueError for a str that is neither digits nor
+        'YYYY-MM-DD'.
+        """
+        if bound is None:
+            return len(self.draw_nos) if end else 0
+        if self.is_date(bound):
+            keys, bound = self.dates, np.datetime64(str(bound).strip()[:10], "D")
+        elif isinstance(bound, str) and not bound.strip().isdigit():
+            raise ValueError(f"Range bound {bound!r} is neither a draw number nor a 'YYYY-MM-DD' date.")
+        else:
+            keys, bound = self.draw_nos, int(bound)
+        return int(np.searchsorted(keys, bound, side="right" if end else "left"))
+
+    def bounds(self, start=None, end=None):
+        lo, hi = self.row(start, False), self.row(end, True)
+        return lo, max(lo, hi)
+
+    def frequencies(self, start=None, end=None):
+        """
+        PositionFrequencies of the draws in [start, end].
+        """
+        lo, hi = self.bounds(start, end)
+        counts = np.asarray(self.cube[hi], dtype=np.int64) - self.cube[lo]
+        counts[:, 0] = 0
+        return PositionFrequencies(counts, counts.sum(axis=1))
+
+    def as_of(self, bound):
+        return self.frequencies(None, bound)
+
+    def all_positions(self, start=None, end=None):
+        """
+        (50,) counts over all seven positions for the draws in [start, end] (index 0 unused).
+        """
+        lo, hi = self.bounds(start, end)
+        counts = np.asarray(self.cube_all[hi], dtype=np.int64) - self.cube_all[lo]
+        counts[0] = 0
+        return counts
+
+    def draw_count(self, start=None, end=None):
+        lo, hi = self.bounds(start, end)
+        return hi - lo
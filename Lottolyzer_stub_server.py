@@ -0,0 +1,202 @@
+import os
+import time
+import random
+import asyncio
+import hashlib
+import argparse
+import datetime
+from aiohttp import web
+
+HISTORY_ROUTE = "/history/singapore/toto/page/{page}/per-page/{per_page}/summary-view"
+
+
+def synthetic_draws(count, first_draw=1, start_date=datetime.date(1990, 1, 1), seed=0):
+    """
+    `count` made-up draws on the Monday/Thursday cadence as (draw_no, date, n1..n6, addl) rows,
+    newest first (the order the site lists them in).
+    """
+    rng = random.Random(seed)
+    rows = []
+    day = start_date
+    for draw_no in range(first_draw, first_draw + count):
+        while day.weekday() not in (0, 3):
+            day += datetime.timedelta(days=1)
+        numbers = rng.sample(range(1, 50), 7)
+        rows.append((draw_no, day.isoformat(), *sorted(numbers[:6]), numbers[6]))
+        day += datetime.timedelta(days=1)
+    rows.reverse()
+    return rows
+
+
+def recorded_draws(db_path):
+    """
+    The draws held in a DrawDatabase file, newest first.
+    """
+    from Draw_database import DrawDatabase
+
+    db = DrawDatabase(db_path)
+    try:
+        return [tuple(row) for row in reversed(db.all_draws())]
+    finally:
+        db.close()
+
+
+def render_page(rows):
+    """
+    History page in the shape the fetcher parses: one <tr> per draw with draw no., date,
+    comma-separated winning numbers and the additional number, plus trailing summary cells.
+    """
+    body = "".join(
+        f"<tr><td><a href=\"#\">{row[0]}</a></td><td>{row[1]}</td>"
+        f"<td>{', '.join(str(n) for n in row[2:8])}</td><td>{row[8]}</td>"
+        f"<td>{sum(row[2:8])}</td><td>{sum(n % 2 for n in row[2:8])}/{sum(1 - n % 2 for n in row[2:8])}</td></tr>"
+        for row in rows
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Singapore Toto History</title></head><body>"
+        "<table id=\"summary-table\"><thead><tr><th>Draw</th><th>Date</th><th>Winning No.</th>"
+        "<th>Addl</th><th>Sum</th><th>Odd/Even</th></tr></thead>"
+        f"<tbody>{body}</tbody></table></body></html>"
+    )
+
+
+class StubHistoryServer:
+    """
+    Local stand-in for the Lottolyzer history pages, for benchmarking TotoDataFetcher offline.
+
+    rows          : draws newest first (synthetic_draws / recorded_draws)
+    latency       : seconds added to every response, plus up to `jitter` seconds at random
+    error_rate    : share of requests answered with a 500
+    rate_429      : share of requests answered with a 429 carrying Retry-After: retry_after
+    max_per_page  : largest per-page value honoured; larger requests get 50 per page like the site
+    max_pages     : pages beyond this return an empty table (None: as many as the rows need)
+    Responses carry an ETag, so conditional requests are answered with 304.
+    """
+
+    def __init__(self, rows, latency=0.0, jitter=0.0, error_rate=0.0, rate_429=0.0, retry_after=1,
+                 max_per_page=500, max_pages=None, seed=None):
+        self.rows = rows
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.max_per_page = max_per_page
+        self.max_pages = max_pages
+        self.rng = random.Random(seed)
+        self.stats = {"requests": 0, "200": 0, "304": 0, "429": 0, "500": 0}
+        self.runner = None
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_get(HISTORY_ROUTE, self.handle_history)
+        return app
+
+    async def handle_history(self, request):
+        self.stats["requests"] += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self.rng.uniform(0, self.jitter))
+        roll = self.rng.random()
+        if roll < self.rate_429:
+            self.stats["429"] += 1
+            return web.Response(status=429, headers={"Retry-After": str(self.retry_after)})
+        if roll < self.rate_429 + self.error_rate:
+            self.stats["500"] += 1
+            return web.Response(status=500)
+
+        page = int(request.match_info["page"])
+        per_page = int(request.match_info["per_page"])
+        if per_page > self.max_per_page:
+            per_page = 50
+        rows = []
+        if self.max_pages is None or page <= self.max_pages:
+            rows = self.rows[(page - 1) * per_page:page * per_page]
+        text = render_page(rows)
+        etag = '"' + hashlib.sha1(text.encode("utf-8")).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            self.stats["304"] += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        self.stats["200"] += 1
+        return web.Response(text=text, content_type="text/html", headers={"ETag": etag})
+
+    async def start(self, host="127.0.0.1", port=8765):
+        self.runner = web.AppRunner(self.make_app())
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host, port).start()
+        return f"http://{host}:{port}"
+
+    async def stop(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+
+async def benchmark(server, host, port, work_dir, fetch_options=None):
+    """
+    Cold backfill of the whole stub history into a fresh database under work_dir, then an
+    incremental run; prints timings together with the server's and the fetcher's counters.
+    The backfill is planned from the stub's draw count, as run() plans it from the draws the
+    workbook-seeded database already holds.
+    """
+    from Draw_database import DrawDatabase
+    from database_analysis import TotoDataFetcher
+
+    base_url = await server.start(host, port)
+    try:
+        os.makedirs(work_dir, exist_ok=True)
+        fetcher = TotoDataFetcher(os.path.join(work_dir, "benchmark.xlsx"), use_cache=False,
+                                  base_url=base_url, fetch_options=fetch_options)
+        start = time.perf_counter()
+        rows = await fetcher.get_all_draws(known_count=len(server.rows))
+        elapsed = time.perf_counter() - start
+        print(f"Cold backfill: {len(rows)} of {len(server.rows)} draws in {elapsed:.2f}s "
+              f"({len(rows) / elapsed:.0f} draws/s), server counters {server.stats}")
+        db = DrawDatabase(fetcher.db_path)
+        try:
+            db.upsert_rows(rows)
+            start = time.perf_counter()
+            new_rows, complete = await fetcher.get_new_draws(db.latest_draw_no())
+            print(f"Incremental check: {len(new_rows)} new draws (complete={complete}) "
+                  f"in {time.perf_counter() - start:.2f}s")
+        finally:
+            db.close()
+    finally:
+        await server.stop()
+
+
+async def serve_forever(server, host, port):
+    base_url = await server.start(host, port)
+    print(f"Serving {len(server.rows)} draws at {base_url}{HISTORY_ROUTE}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the Lottolyzer Toto history pages.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--draws", type=int, default=10000, help="number of synthetic draws")
+    parser.add_argument("--db", help="serve the draws recorded in this DrawDatabase file instead")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1)
+    parser.add_argument("--max-per-page", type=int, default=500)
+    parser.add_argument("--max-pages", type=int)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--benchmark", metavar="WORK_DIR",
+                        help="run a cold backfill and an incremental check against the stub, then exit")
+    args = parser.parse_args()
+
+    stub_rows = recorded_draws(args.db) if args.db else synthetic_draws(args.draws)
+    stub = StubHistoryServer(stub_rows, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                             rate_429=args.rate_429, retry_after=args.retry_after,
+                             max_per_page=args.max_per_page, max_pages=args.max_pages, seed=args.seed)
+    if args.benchmark:
+        asyncio.run(benchmark(stub, args.host, args.port, args.benchmark,
+                              fetch_options={"rate": 1000, "burst": 100, "limit_per_host": 8}))
+    else:
+        asyncio.run(serve_forever(stub, args.host, args.port))
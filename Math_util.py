@@ -4,6 +4,7 @@ from collections import Counter
 from docx.shared import RGBColor
 
 import re
+import numpy as np
 
 
 class MathUtils:
@@ -27,6 +28,39 @@ class MathUtils:
 
         return sorted(combined_percentages.items())  # Return sorted values
 
+    def has_counts(self, position_counts, draw_total):
+        """
+    True when Data_storage_Lib holds raw counts (position_counts / draw_total) to derive percentages from.
+    """
+        return position_counts is not None and len(position_counts) > 0 and bool(draw_total)
+
+    def percentages_from_counts(self, position_counts, draw_total):
+        """
+    Converts the 7 x 50 occurrence counts (row = position C..I, column = ball value)
+    into percentages of draw_total. Nothing is rounded, unlike the 'Value X: (Y%)' strings.
+    """
+        counts = np.asarray(position_counts, dtype=np.float64)
+        if not draw_total:
+            return np.zeros_like(counts)
+        return counts * (100.0 / draw_total)
+
+    def position_percent_dict(self, position_counts, draw_total, position):
+        """
+    {value: percentage} for one position (0 = C ... 6 = I), only for values that occurred,
+    i.e. the same entries list_percent1..7 hold.
+    """
+        counts = np.asarray(position_counts)[position]
+        percents = self.percentages_from_counts(position_counts, draw_total)[position]
+        return {int(value): float(percents[value]) for value in np.flatnonzero(counts)}
+
+    def total_percent_dict(self, position_counts, draw_total):
+        """
+    {value: percentage} averaged over the 7 positions, the same normalisation as total_percent_list.
+    """
+        counts = np.asarray(position_counts)
+        percents = self.percentages_from_counts(counts, draw_total).sum(axis=0) / len(counts)
+        return {int(value): float(percents[value]) for value in np.flatnonzero(counts.sum(axis=0))}
+
 
         
     def calculate_percentage_and_add_paragraph(doc, table):
@@ -0,0 +1,140 @@
+import os
+import gzip
+import lzma
+import json
+import hashlib
+
+COMPRESSORS = {
+    "gzip": (".html.gz", gzip.compress, gzip.decompress),
+    "lzma": (".html.xz", lzma.compress, lzma.decompress),
+}
+
+
+class PageCache:
+    """
+    On-disk cache of fetched history pages, keyed by URL (sha1 of the URL as the file name).
+
+    For every URL it keeps:
+      - <key>.html.gz / <key>.html.xz : the compressed HTML,
+      - <key>.json                    : url, ETag, Last-Modified, sha256 of the HTML and the rows
+                                        parsed from it (so an unchanged page is never parsed twice).
+    The fetcher sends If-None-Match / If-Modified-Since from the stored validators, reuses the
+    cached page on a 304, and in offline mode serves pages from here without any network access.
+    """
+
+    def __init__(self, cache_dir="page_cache", compression="gzip"):
+        if compression not in COMPRESSORS:
+            raise ValueError(f"Unknown compression '{compression}', expected one of {sorted(COMPRESSORS)}")
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.compression = compression
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def url_key(url):
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def content_hash(text):
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def meta_path(self, url):
+        return os.path.join(self.cache_dir, self.url_key(url) + ".json")
+
+    @staticmethod
+    def write_atomic(path, data):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    # ---------- reading ----------
+    def get(self, url):
+        """
+        Metadata dict stored for url, or None when the page was never cached.
+        """
+        try:
+            with open(self.meta_path(url), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def read_text(self, url):
+        """
+        The cached HTML for url, or None.
+        """
+        meta = self.get(url)
+        if meta is None:
+            return None
+        suffix, _, decompress = COMPRESSORS[meta.get("compression", "gzip")]
+        try:
+            with open(os.path.join(self.cache_dir, self.url_key(url) + suffix), "rb") as f:
+                return decompress(f.read()).decode("utf-8")
+        except (OSError, EOFError, lzma.LZMAError, gzip.BadGzipFile):
+            return None
+
+    def conditional_headers(self, url):
+        """
+        If-None-Match / If-Modified-Since headers for a revalidating request (empty when uncached).
+        """
+        meta = self.get(url)
+        headers = {}
+        if meta is None:
+            return headers
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def rows_for(self, url, text):
+        """
+        The rows parsed earlier from exactly this HTML (same content hash), or None.
+        """
+        meta = self.get(url)
+        if meta is None or meta.get("rows") is None or meta.get("content_hash") != self.content_hash(text):
+            return None
+        return [tuple(row) for row in meta["rows"]]
+
+    def urls(self):
+        """
+        Every cached URL (for offline replays and parser benchmarks).
+        """
+        urls = []
+        for name in sorted(os.listdir(self.cache_dir)):
+            if name.endswith(".json"):
+                with open(os.path.join(self.cache_dir, name), "r", encoding="utf-8") as f:
+                    urls.append(json.load(f)["url"])
+        return urls
+
+    # ---------- writing ----------
+    def store(self, url, text, headers=None):
+        """
+        Saves a freshly downloaded page with its validators. The parsed rows are kept when the
+        content hash is unchanged. Returns True if the content differs from the cached copy.
+        """
+        headers = headers or {}
+        digest = self.content_hash(text)
+        meta = self.get(url) or {}
+        changed = meta.get("content_hash") != digest
+        if changed or meta.get("compression") != self.compression:
+            suffix, compress, _ = COMPRESSORS[self.compression]
+            self.write_atomic(os.path.join(self.cache_dir, self.url_key(url) + suffix), compress(text.encode("utf-8")))
+        self.write_meta(url, {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "content_hash": digest,
+            "compression": self.compression,
+            "rows": None if changed else meta.get("rows"),
+        })
+        return changed
+
+    def store_rows(self, url, rows):
+        meta = self.get(url)
+        if meta is None:
+            return
+        meta["rows"] = [list(row) for row in rows]
+        self.write_meta(url, meta)
+
+    def write_meta(self, url, meta):
+        self.write_atomic(self.meta_path(url), json.dumps(meta).encode("utf-8"))
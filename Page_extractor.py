@@ -0,0 +1,86 @@
+import re
+import html
+
+try:
+    import lxml.html
+except ImportError:  # lxml is optional; the regex extractor needs nothing
+    lxml = None
+
+ROW_PATTERN = re.compile(r"<tr\b[^>]*>(.*?)</tr>", re.IGNORECASE | re.DOTALL)
+CELL_PATTERN = re.compile(r"<td\b[^>]*>(.*?)</td>", re.IGNORECASE | re.DOTALL)
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+def make_row(cells):
+    """
+    Turns the text of the first four cells (draw no., date, winning numbers, additional)
+    into a compact tuple (draw_no, date, n1..n6, addl) of ints, or None for non-draw rows.
+    """
+    if len(cells) < 4:
+        return None
+    try:
+        draw_no = int(cells[0])
+        numbers = [int(n.strip()) for n in cells[2].split(",") if n.strip()][:6]
+        addl = int(cells[3]) if cells[3] else None
+    except ValueError:
+        return None
+    numbers += [None] * (6 - len(numbers))
+    return (draw_no, cells[1][:10], *numbers, addl)
+
+
+def extract_rows_regex(text):
+    """
+    Targeted scan of the results table: <tr> blocks, their <td> cells, tags stripped.
+    """
+    rows = []
+    for row_html in ROW_PATTERN.findall(text):
+        cells = [html.unescape(TAG_PATTERN.sub("", cell)).strip() for cell in CELL_PATTERN.findall(row_html)]
+        row = make_row(cells)
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+def extract_rows_lxml(text):
+    rows = []
+    for tr in lxml.html.fromstring(text).iter("tr"):
+        cells = [td.text_content().strip() for td in tr.findall("td")]
+        row = make_row(cells)
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+def extract_rows_bs4(text):
+    from bs4 import BeautifulSoup
+
+    rows = []
+    for tr in BeautifulSoup(text, "html.parser").find_all("tr"):
+        cells = [td.get_text(strip=True) for td in tr.find_all("td")]
+        row = make_row(cells)
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+EXTRACTORS = {
+    "lxml": extract_rows_lxml,
+    "regex": extract_rows_regex,
+    "bs4": extract_rows_bs4,
+}
+
+
+def default_backend():
+    return "lxml" if lxml is not None else "regex"
+
+
+def extract_rows(text, backend=None):
+    """
+    Extracts the draws on a history page as (draw_no, date, n1..n6, addl) tuples, page order.
+    backend: "lxml", "regex" or "bs4"; defaults to lxml when installed, otherwise regex.
+    Module-level so it can be sent to a ProcessPoolExecutor.
+    """
+    backend = backend or default_backend()
+    if backend == "lxml" and lxml is None:
+        backend = "regex"
+    return EXTRACTORS[backend](text)
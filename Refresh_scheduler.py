@@ -0,0 +1,163 @@
+import os
+import sys
+import time
+import asyncio
+import datetime
+from database_analysis import TotoDataFetcher
+from Draw_matrix import DrawMatrix
+from Scripwriter import BackendScriptWriter
+from lib_function import Lib_functions, total_list_cal_script
+from Data_store import ColumnarDataStore, load_storage_namespace
+
+SGT = datetime.timezone(datetime.timedelta(hours=8), "SGT")
+DRAW_DAYS = (0, 3)  # Monday, Thursday
+PUBLISH_TIME = datetime.time(18, 30)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class DrawRefreshScheduler:
+    """
+    Long-running refresher that follows the Toto draw cadence (Monday/Thursday, results from
+    about 6:30pm SGT). Outside the publish windows it sleeps; inside one it polls page 1 with
+    growing intervals (first_poll, doubled up to max_poll) until a draw newer than the stored
+    one appears or the window closes. A new draw triggers TotoDataFetcher.run (incremental
+    fetch, gap fill, workbook insert, reusing the page 1 just polled); whenever that changed the
+    workbook (new, corrected or gap-filled draws) the analysis database Data_storage_Lib.py and
+    its columnar store are recomputed in-process. The Word reports (Data_prepare.py) are not
+    regenerated from here.
+
+        python Refresh_scheduler.py          # run forever
+        python Refresh_scheduler.py --once   # check now, refresh if needed, exit
+    """
+
+    def __init__(self, fetcher=None, draw_days=DRAW_DAYS, publish_time=PUBLISH_TIME,
+                 window=datetime.timedelta(hours=3), first_poll=datetime.timedelta(minutes=2),
+                 max_poll=datetime.timedelta(minutes=20)):
+        self.fetcher = fetcher or TotoDataFetcher(os.path.join(SCRIPT_DIR, "database_analysis.xlsx"))
+        self.data_dir = os.path.dirname(self.fetcher.workbook_path)
+        self.draw_days = draw_days
+        self.publish_time = publish_time
+        self.window = window
+        self.first_poll = first_poll
+        self.max_poll = max_poll
+
+    def now(self):
+        return datetime.datetime.now(SGT)
+
+    def sleep(self, seconds):
+        time.sleep(max(0.0, seconds))
+
+    def next_slot(self, now):
+        """
+        Start of the publish window that is open at `now`, or of the next one.
+        """
+        day = now.date()
+        while True:
+            start = datetime.datetime.combine(day, self.publish_time, tzinfo=SGT)
+            if day.weekday() in self.draw_days and start + self.window > now:
+                return start
+            day += datetime.timedelta(days=1)
+
+    def stored_latest(self):
+        db = self.fetcher.open_database()  # imports the workbook into a new database first
+        try:
+            return db.latest_draw_no()
+        finally:
+            db.close()
+
+    def check_once(self):
+        """
+        Compares page 1 with the database. Returns the site's newest draw number when it is
+        newer than the stored one, else None.
+        The parsed page 1 stays with the fetcher, so a refresh right after does not request it again.
+        """
+        site_latest = asyncio.run(self.fetcher.latest_site_draw())
+        stored = self.stored_latest()
+        if site_latest is None:
+            print(f"[{self.now():%Y-%m-%d %H:%M}] Page 1 could not be fetched.")
+            return None
+        if stored is not None and site_latest <= stored:
+            print(f"[{self.now():%Y-%m-%d %H:%M}] No new draw (latest {stored}).")
+            self.fetcher.prefetched.clear()  # stale by the next poll
+            return None
+        print(f"[{self.now():%Y-%m-%d %H:%M}] New draw {site_latest} (stored {stored}).")
+        return site_latest
+
+    def recompute(self):
+        """
+        Same analysis steps as Data_prepare.py, run in the workbook's folder: the distinct values
+        of C..I, list_percent/list_highest/list_lowest with position_counts and draw_total (the
+        rolling counts append only the new draws), the total_percent lists, then the columnar
+        draw store and the memory-mapped Data_storage_Lib namespace are rebuilt.
+        """
+        cwd = os.getcwd()
+        os.chdir(self.data_dir)
+        try:
+            matrix = DrawMatrix.get(self.fetcher.workbook_path, "Data")
+            with BackendScriptWriter().transaction('Data_storage_Lib.py') as batch:
+                for column in ['C', 'D', 'E', 'F', 'G', 'H', 'I']:
+                    batch[column] = matrix.count_column_values(column)
+            Lib_functions('All').list_percent_function()
+            total_list_cal_script().total_list_percent_calculation()
+            store = ColumnarDataStore('Data_storage_Lib.py')
+            store.sync_draws(self.fetcher.workbook_path)
+            load_storage_namespace(store.script_path)
+        finally:
+            os.chdir(cwd)
+
+    def refresh(self):
+        """
+        Incremental fetch into the database and workbook; the analysis database is recomputed
+        whenever the workbook changed. Returns True if it was.
+        """
+        written = self.fetcher.run()
+        if not written:
+            print("Workbook unchanged; nothing to recompute.")
+            return False
+        print(f"{written} workbook rows written; recomputing Data_storage_Lib.py.")
+        self.recompute()
+        return True
+
+    def poll_window(self, slot):
+        """
+        Polls from the slot start until a new draw is found or the window closes.
+        Returns True if a refresh ran.
+        """
+        interval = self.first_poll
+        while True:
+            now = self.now()
+            if now >= slot + self.window:
+                print(f"No new draw within the window starting {slot:%Y-%m-%d %H:%M}.")
+                return False
+            if now < slot:
+                self.sleep((slot - now).total_seconds())
+                continue
+            if self.check_once() is not None:
+                self.refresh()
+                return True
+            remaining = slot + self.window - self.now()
+            self.sleep(min(interval, remaining).total_seconds())
+            interval = min(self.max_poll, interval * 2)
+
+    def run_forever(self):
+        """
+        Catches up once at start (a draw may have been published while the scheduler was down),
+        then waits for each publish window in turn.
+        """
+        if self.check_once() is not None:
+            self.refresh()
+        done_until = self.now()
+        while True:
+            slot = self.next_slot(max(self.now(), done_until))
+            print(f"Next publish window: {slot:%a %Y-%m-%d %H:%M %Z}")
+            self.poll_window(slot)
+            done_until = slot + self.window
+
+
+if __name__ == "__main__":
+    scheduler = DrawRefreshScheduler()
+    if "--once" in sys.argv[1:]:
+        if scheduler.check_once() is not None:
+            scheduler.refresh()
+    else:
+        scheduler.run_forever()
@@ -39,6 +39,25 @@ class BackendScriptWriter:
     - target_script_name: The name of the script to modify (including file extension).
     - variable_name: The name of the variable (list) to overwrite.
     - values: A list of values to assign to the variable.
+    """
+        self.overwrite_variables_script(target_script_name, {variable_name: values})
+        print(f"Variable '{variable_name}' overwritten successfully with new values!")
+
+    def overwrite_variables_script(self, target_script_name, updates, splice=True):
+        """
+    Overwrite several variables of a Python script in one transaction.
+    The script is read and parsed once, every update is applied in the same pass,
+    and the result is written back atomically (temp file + rename), so either all
+    variables are updated or the file is left untouched.
+
+    With splice=True (default) only the source text of each replaced value is swapped,
+    using the assignment's lineno/end_lineno/col_offset; every other byte of the file,
+    comments included, is copied unchanged. splice=False regenerates the whole module
+    with ast.unparse.
+
+    Arguments:
+    - target_script_name: The name of the script to modify (including file extension).
+    - updates: A dict of {variable_name: values}.
     """
         target_script_path = os.path.join(os.getcwd(), target_script_name)
     
@@ -46,37 +65,91 @@ class BackendScriptWriter:
         if not os.path.exists(target_script_path):
             raise FileNotFoundError(f"Script {target_script_name} not found in the current directory.")
     
-    # Read the existing content of the target script
+        if splice:
+            index = ScriptIndex.get(target_script_path)
+            missing = [name for name in updates if index.node(name) is None]
+            if missing:
+                raise ValueError(f"Variable(s) {', '.join(repr(name) for name in missing)} not found in the script.")
+            replacements = {}
+            for name, values in updates.items():
+                node = index.node(name)
+                if isinstance(node.value, ast.List):
+                    replacements[id(node)] = (node.value, repr(list(values)))
+                else:
+                    replacements[id(node)] = (node.value, repr(values))
+            self.atomic_write(target_script_path, self.splice_source(index.source, replacements.values()))
+            print(f"{len(updates)} variable(s) spliced into '{target_script_name}' in one write.")
+            return
+    
         with open(target_script_path, "r") as f:
             target_script_content = f.read()
     
-    # Parse the script into an AST
         tree = ast.parse(target_script_content)
+        pending = dict(updates)
     
-    # Flag to track if we find the variable assignment
-        variable_found = False
-    
-    # Traverse the AST and modify the list variable
+    # Only the first assignment of each variable is modified, as overwritelist_script always did
         for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                if isinstance(node.targets[0], ast.Name) and node.targets[0].id == variable_name:
-                    variable_found = True
-                # Check if the assigned value is a list
-                    if isinstance(node.value, ast.List):
-                    # Create new list elements with the provided values
-                        node.value.elts = [ast.Constant(value=v) for v in values]
-                    else:
-                    # Handle non-list assignments (e.g., strings, integers, etc.)
-                        node.value = ast.Constant(value=values)  # Convert values to a constant
-                    break  # Exit the loop once we've modified the variable
-    
-        if not variable_found:
-            raise ValueError(f"Variable '{variable_name}' not found in the script.")
-    
-    # Write the modified AST back to the file
-        with open(target_script_path, "w") as f:
-            f.write(ast.unparse(tree))  # Ensure you're using Python 3.9+ for ast.unparse
-            print(f"Variable '{variable_name}' overwritten successfully with new values!")
+            if not pending:
+                break
+            if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name) and node.targets[0].id in pending:
+                values = pending.pop(node.targets[0].id)
+                if isinstance(node.value, ast.List):
+                    node.value.elts = [ast.Constant(value=v) for v in values]
+                else:
+                # Handle non-list assignments (e.g., strings, integers, etc.)
+                    node.value = ast.Constant(value=values)
+    
+        if pending:
+            raise ValueError(f"Variable(s) {', '.join(repr(name) for name in pending)} not found in the script.")
+    
+        self.atomic_write(target_script_path, ast.unparse(tree))
+        print(f"{len(updates)} variable(s) committed to '{target_script_name}' in one write.")
+
+    def splice_source(self, source, replacements):
+        """
+    Replace the source ranges of AST nodes in the original script bytes.
+
+    Arguments:
+    - source: The script content as bytes (col_offset values are UTF-8 byte offsets).
+    - replacements: Iterable of (node, new_text) pairs; ranges must not overlap.
+    """
+        line_starts = [0]
+        for line in source.splitlines(keepends=True):
+            line_starts.append(line_starts[-1] + len(line))
+        edits = sorted(
+            (line_starts[node.lineno - 1] + node.col_offset,
+             line_starts[node.end_lineno - 1] + node.end_col_offset,
+             text.encode("utf-8"))
+            for node, text in replacements
+        )
+        parts = []
+        position = 0
+        for start, end, data in edits:
+            parts.append(source[position:start])
+            parts.append(data)
+            position = end
+        parts.append(source[position:])
+        return b"".join(parts)
+
+    def atomic_write(self, target_script_path, content):
+        """
+    Write content (str or bytes) to a temporary file next to the target and rename it
+    over the target, so readers never see a partially written script.
+    """
+        tmp_path = target_script_path + ".tmp"
+        with open(tmp_path, "wb" if isinstance(content, bytes) else "w") as f:
+            f.write(content)
+        os.replace(tmp_path, target_script_path)
+
+    def transaction(self, target_script_name):
+        """
+    Collect variable updates and commit them in one write:
+
+        with writer.transaction('Data_storage_Lib.py') as batch:
+            batch['C'] = [...]
+            batch['D'] = [...]
+    """
+        return ScriptTransaction(self, target_script_name)
 
 
     #list_append_script with ast module, update content in list variable
@@ -86,21 +159,18 @@ class BackendScriptWriter:
         
     
         target_script_path = os.path.join(os.getcwd(), target_script_name)
-        with open(target_script_path, "r") as f:
-            target_script_content = f.read()
-    
-        tree = ast.parse(target_script_content)
-    
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                if node.targets[0].id == variable_name:
-                    node.value.elts.extend([ast.Num(n=x) for x in new_value])
-                    break
-    
-        updated_script_content = ast.unparse(tree)
-    
-        with open(target_script_path, "w") as f:
-            f.write(updated_script_content)
+        index = ScriptIndex.get(target_script_path)
+        node = index.node(variable_name)
+        if node is None or not isinstance(node.value, ast.List):
+            raise ValueError(f"List '{variable_name}' not found in the script.")
+    
+    # Splice the new elements in before the closing bracket; the rest of the file is untouched
+        list_text = ast.get_source_segment(index.source.decode("utf-8"), node.value)
+        items = ", ".join(repr(x) for x in new_value)
+        if node.value.elts and items:
+            items = ", " + items
+        updated_text = list_text[:-1].rstrip() + items + "]"
+        self.atomic_write(target_script_path, self.splice_source(index.source, [(node.value, updated_text)]))
     
         print("Variable list updated successfully!")
 
@@ -145,27 +215,19 @@ class BackendScriptWriter:
         if not os.path.exists(script_path):
             raise FileNotFoundError(f"Script {script_name} not found in the current directory.")
     
-    # Read and parse the script content
-        with open(script_path, 'r') as f:
-            script_content = f.read()
-        tree = ast.parse(script_content)
-    
-    # Search for the list variable in the AST
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name) and target.id == list_name:
-                        value_list = node.value
-                        if isinstance(value_list, ast.List):
-                            print(f"Values in {list_name}:")
-                            for element in value_list.elts:
-                                if isinstance(element, ast.Constant):  # Handle constant elements (e.g., 1, 'a', 5.5)
-                                    print(element.value)
-                                elif isinstance(element, ast.Name):  # Handle variable names (e.g., x, my_var)
-                                    print(f"Variable: {element.id}")
-                                else:
-                                    print(f"Expression: {ast.dump(element)}")  # Handle complex expressions
-                            return  # Exit after processing the list
+    # Look the list variable up in the (cached) symbol table
+        for node in ScriptIndex.get(script_path).nodes(list_name):
+            value_list = node.value
+            if isinstance(value_list, ast.List):
+                print(f"Values in {list_name}:")
+                for element in value_list.elts:
+                    if isinstance(element, ast.Constant):  # Handle constant elements (e.g., 1, 'a', 5.5)
+                        print(element.value)
+                    elif isinstance(element, ast.Name):  # Handle variable names (e.g., x, my_var)
+                        print(f"Variable: {element.id}")
+                    else:
+                        print(f"Expression: {ast.dump(element)}")  # Handle complex expressions
+                return  # Exit after processing the list
     
         print(f"List '{list_name}' not found in the script.")
 
@@ -173,29 +235,24 @@ class BackendScriptWriter:
     def get_total_list_value(self, script_name, variable_name):
         target_script_path = os.path.join(os.getcwd(), script_name)
         
-        with open(target_script_path, "r") as f:
-            target_script_content = f.read()
-        
-        # Parse the content into an AST (Abstract Syntax Tree)
-        tree = ast.parse(target_script_content)
+        # Parsed once and cached until the file changes
+        index = ScriptIndex.get(target_script_path)
         
         # Step 1: Retrieve the list assigned to the variable_name
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                if isinstance(node.targets[0], ast.Name) and node.targets[0].id == variable_name:
-                    if isinstance(node.value, (ast.List, ast.Tuple)):  # Handle both list and tuple types
-                        # Extract values from the list or tuple
-                        values = [self.resolve_value_from_ast(element, tree) for element in node.value.elts]
-                        print(f"Values in list {variable_name}: {values}")
-                        return values
+        node = index.node(variable_name)
+        if node is not None and isinstance(node.value, (ast.List, ast.Tuple)):  # Handle both list and tuple types
+            # Extract values from the list or tuple
+            values = [self.resolve_value_from_ast(element, index) for element in node.value.elts]
+            print(f"Values in list {variable_name}: {values}")
+            return values
         
         print(f"Variable {variable_name} not found or not a list in {script_name}.")
         return []
 
-    def resolve_value_from_ast(self, node, tree):
+    def resolve_value_from_ast(self, node, index):
         """
         Resolves the value from an AST node.
-        If the node is a variable (ast.Name), we find its value in the script.
+        If the node is a variable (ast.Name), we look its value up in the ScriptIndex.
         If the value is another list, we resolve it recursively.
         """
         if isinstance(node, ast.Constant):  # Python 3.9+
@@ -203,41 +260,34 @@ class BackendScriptWriter:
         elif isinstance(node, ast.Num):  # Older Python versions (<3.9)
             return node.n
         elif isinstance(node, ast.Name):  # If it's a variable, find its value
-            variable_value = self.get_variable_value(node.id, tree)
+            variable_value = self.get_variable_value(node.id, index)
             return variable_value
         else:
             print(f"Unsupported AST Node Type: {type(node)}")
             return None
 
-    def get_variable_value(self, variable_name, tree):
+    def get_variable_value(self, variable_name, index):
         """
-        Finds the value assigned to the variable_name in the AST tree.
+        Finds the value assigned to the variable_name through the ScriptIndex name map.
         If the variable is a list, it resolves it recursively.
         """
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                if isinstance(node.targets[0], ast.Name) and node.targets[0].id == variable_name:
-                    if isinstance(node.value, (ast.List, ast.Tuple)):  # Check if it's a list
-                        return [self.resolve_value_from_ast(el, tree) for el in node.value.elts]
-                    elif isinstance(node.value, ast.Name):  # If it's another variable, resolve its value
-                        return self.get_variable_value(node.value.id, tree)
-                    else:
-                        return self.resolve_value_from_ast(node.value, tree)  # Handle other types of assignments
+        node = index.node(variable_name)
+        if node is not None:
+            if isinstance(node.value, (ast.List, ast.Tuple)):  # Check if it's a list
+                return [self.resolve_value_from_ast(el, index) for el in node.value.elts]
+            elif isinstance(node.value, ast.Name):  # If it's another variable, resolve its value
+                return self.get_variable_value(node.value.id, index)
+            else:
+                return self.resolve_value_from_ast(node.value, index)  # Handle other types of assignments
         print(f"Variable {variable_name} not found.")
         return []
 
 
                                  
     def readlist_script(self,script_name, list_name):
-        with open(script_name, 'r') as f:
-            script = f.read()
-        script = ast.parse(script)
-        print("Script parsed successfully!")
-        print(script)
-        for node in ast.walk(script):
-            if isinstance(node, ast.Assign):
-             if node.targets[0].id == list_name:
-                return ast.literal_eval(node.value)
+        node = ScriptIndex.get(script_name).node(list_name)
+        if node is not None:
+            return ast.literal_eval(node.value)
         print("List not found.")
         return None
     def extract_percentage_from_string(value_str):
@@ -272,21 +322,7 @@ class BackendScriptWriter:
         if not os.path.exists(script_path):
             raise FileNotFoundError(f"Script {script_name} not found in the current directory.")
     
-        with open(script_path, 'r') as f:
-            script_content = f.read()
-    
-        tree = ast.parse(script_content)
-        variable_count = 0  # Counter for element.id occurrences
-    
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name) and target.id == list_name:
-                        value_list = node.value
-                        if isinstance(value_list, ast.List):
-                            for element in value_list.elts:
-                                if isinstance(element, ast.Name):  # Count occurrences of variable names
-                                    variable_count += 1
+        variable_count = ScriptIndex.get(script_path).count_name_references(list_name)
     
         print(f"Number of variable references (element.id) inside '{list_name}': {variable_count}")
         return variable_count
@@ -306,9 +342,73 @@ class BackendScriptWriter:
         if not os.path.exists(script_path):
             return 0
     
-        with open(script_path, 'r') as f:
-            tree = ast.parse(f.read())
-    
-        return sum(1 for node in ast.walk(tree) if isinstance(node, ast.Assign) 
-               for target in node.targets if isinstance(target, ast.Name) and target.id == list_name 
-               for element in getattr(node.value, 'elts', []) if isinstance(element, ast.Name))
+        return ScriptIndex.get(script_path).count_name_references(list_name)
+
+
+class ScriptIndex:
+    """
+    Symbol table of a script: parsed once, maps every variable name to its assignment nodes
+    (in ast.walk order, so the first entry is the one the old per-call ast.walk found).
+    Use ScriptIndex.get(path), which reuses the index until the file's mtime or size changes.
+    """
+    _cache = {}
+
+    def __init__(self, script_path):
+        self.script_path = script_path
+        stat = os.stat(script_path)
+        self.stamp = (stat.st_mtime_ns, stat.st_size)
+        with open(script_path, "rb") as f:
+            self.source = f.read()  # Raw bytes, kept for splicing (AST offsets are UTF-8 byte offsets)
+        self.tree = ast.parse(self.source)
+        self.assignments = {}
+        for node in ast.walk(self.tree):
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        self.assignments.setdefault(target.id, []).append(node)
+
+    @classmethod
+    def get(cls, script_path):
+        script_path = os.path.abspath(script_path)
+        stat = os.stat(script_path)
+        index = cls._cache.get(script_path)
+        if index is None or index.stamp != (stat.st_mtime_ns, stat.st_size):
+            index = cls(script_path)
+            cls._cache[script_path] = index
+        return index
+
+    def nodes(self, name):
+        return self.assignments.get(name, [])
+
+    def node(self, name):
+        """
+        First assignment of `name`, or None.
+        """
+        nodes = self.assignments.get(name)
+        return nodes[0] if nodes else None
+
+    def count_name_references(self, name):
+        """
+        Number of variable references (ast.Name elements) inside the list(s) assigned to `name`.
+        """
+        return sum(1 for node in self.nodes(name)
+                   for element in getattr(node.value, 'elts', []) if isinstance(element, ast.Name))
+
+
+class ScriptTransaction(dict):
+    """
+    Dict of pending {variable_name: values} updates that is committed through
+    BackendScriptWriter.overwrite_variables_script when the with-block exits cleanly.
+    """
+    def __init__(self, writer, target_script_name):
+        super().__init__()
+        self.writer = writer
+        self.target_script_name = target_script_name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and self:
+            self.writer.overwrite_variables_script(self.target_script_name, dict(self))
+        return False
@@ -3,7 +3,8 @@ import re
 from collections import Counter
 from docx import Document
 from docx.shared import RGBColor
-from Data_storage_Lib import total_percent_list  # Import the external percentage list
+from Data_store import LazyStorageNamespace  # Loads only the needed variables from Data_storage_Lib.py
+from Math_util import MathUtils
 
 class summary_percentage_writer:
     def __init__(self, input_filename="output_tables.docx", output_filename="percentage_total_percent.docx"):
@@ -32,8 +33,18 @@ class summary_percentage_writer:
         """
         Parse total_percent_list into a dictionary {value: percentage}.
         For example: {22.0: 2.38, 31.0: 2.32, ...}
+        When Data_storage_Lib holds raw counts, the percentages are derived from them instead.
         """
         parsed_data = {}
+        storage = LazyStorageNamespace()
+        position_counts = storage.get("position_counts")
+        draw_total = storage.get("draw_total", 0)
+        math_utils = MathUtils()
+        if math_utils.has_counts(position_counts, draw_total):
+            totals = math_utils.total_percent_dict(position_counts, draw_total)
+            return {float(value): percentage for value, percentage in totals.items()}
+
+        total_percent_list = storage.get("total_percent_list", [])
         for item in total_percent_list:
             value, percentage = self.extract_percentage(item)
             if value is not None:
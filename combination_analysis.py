@@ -1,16 +1,15 @@
 import os
 import re
 import random
-import importlib.util
 import sys
 from datetime import datetime
 from docx import Document
+from Data_store import LazyStorageNamespace
+from Data_update_log import StorageUpdateLog
 
 def load_data_storage(file_path):
-    spec = importlib.util.spec_from_file_location("Data_storage_Lib", file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+    # Variables are only executed when first accessed (e.g. ds_module.predict_dict)
+    return LazyStorageNamespace(file_path)
 
 def parse_table_analysis(file_path):
     doc = Document(file_path)
@@ -122,13 +121,8 @@ def generate_predictions(num_results, trend_mode):
     # Only update Data_storage_Lib.py if the prediction count is low enough
     if num_results <= 20:
         print("DEBUG: Updating Data_storage_Lib.py")
-        with open(ds_file, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        new_lines = [line for line in lines if "predict_dict" not in line]
-        new_lines.append("\n# Updated predictions dictionary\n")
-        new_lines.append("predict_dict = " + repr(predict_dict) + "\n")
-        with open(ds_file, "w", encoding="utf-8") as f:
-            f.write("".join(new_lines))
+        # Logged as one small record; folded into the script on the next compaction
+        StorageUpdateLog(ds_file).replace_predictions(predict_dict)
     else:
         print("DEBUG: Skipping update of Data_storage_Lib.py for high prediction count")
 
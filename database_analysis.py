@@ -1,9 +1,17 @@
 import os
 import asyncio
-import aiohttp
-from bs4 import BeautifulSoup
-import openpyxl
+from concurrent.futures import ProcessPoolExecutor
 import socket
+from urllib.parse import urlsplit
+from Draw_database import DrawDatabase
+from Fetch_engine import FetchEngine
+from Page_extractor import extract_rows, default_backend
+from Page_cache import PageCache
+
+PER_PAGE_CANDIDATES = (500, 200, 100, 50)  # largest first; 50 is the site's default page size
+DEFAULT_PER_PAGE = 50
+DEFAULT_BASE_URL = "https://en.lottolyzer.com"
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1"}
 
 def is_connected(host="8.8.8.8", port=53, timeout=3):
     """
@@ -19,184 +27,520 @@ def is_connected(host="8.8.8.8", port=53, timeout=3):
     except Exception:
         return False
 
-def create_workbook(workbook_path):
-    """
-    Creates a new Excel workbook (.xlsx) using openpyxl and saves it.
-    """
-    wb = openpyxl.Workbook()
-    wb.save(os.path.abspath(workbook_path))
-
 class TotoDataFetcher:
-    def __init__(self, workbook_path="database_analysis.xlsx"):
+    def __init__(self, workbook_path="database_analysis.xlsx", db_path=None, fetch_options=None,
+                 parse_backend=None, parse_workers=0, use_cache=True, cache_compression="gzip", offline=False,
+                 adaptive_page_size=True, base_url=DEFAULT_BASE_URL):
         """
         Initializes the TotoDataFetcher with the given workbook path.
+        The draw history itself lives in a SQLite database next to the workbook;
+        the workbook is exported from it.
+        fetch_options are passed to FetchEngine (limit_per_host, rate, burst, timeout, max_retries, ...).
+        parse_backend selects the Page_extractor backend ("lxml", "regex" or "bs4"; default: fastest available).
+        parse_workers > 0 parses multi-page backfills in a process pool of that size. The pool
+        re-imports the __main__ module on Windows, so only enable it from scripts with a
+        `if __name__ == "__main__":` guard.
+        use_cache keeps every fetched page in a compressed PageCache (page_cache/ next to the workbook):
+        requests are revalidated with ETag/Last-Modified and unchanged pages are not parsed again.
+        offline=True replays pages from that cache only, without touching the network.
+        adaptive_page_size lets backfills probe for the largest per-page value the site accepts
+        (PER_PAGE_CANDIDATES) instead of always requesting 50 draws per page.
+        base_url points the fetcher at another host serving the same pages, e.g. the local
+        Lottolyzer_stub_server; the connectivity check is skipped for local hosts.
         """
         self.workbook_path = os.path.abspath(workbook_path)
-        self.wb = None
-        self.ws = None
+        self.db_path = os.path.abspath(db_path) if db_path else os.path.splitext(self.workbook_path)[0] + ".sqlite"
+        self.fetch_options = fetch_options or {}
+        self.parse_backend = parse_backend or default_backend()
+        self.parse_workers = parse_workers
+        self.offline = offline
+        self.cache = None
+        if use_cache or offline:
+            cache_dir = os.path.join(os.path.dirname(self.workbook_path), "page_cache")
+            self.cache = PageCache(cache_dir, cache_compression)
+        self.adaptive_page_size = adaptive_page_size
+        self.base_url = base_url.rstrip("/")
+        self.per_page = None  # page size in use once probed; DEFAULT_PER_PAGE until then
+        self.site_latest = None  # newest draw number seen on page 1
+        self.prefetched = {}  # (per_page, page) -> rows already parsed (the probe's page 1)
+        self.failed_pages = []  # (per_page, page) pairs that could not be fetched
+        self.failed_ranges = []  # draw-number spans of backfill pages that failed, stored by run()
+
+    def is_local(self):
+        return urlsplit(self.base_url).hostname in LOCAL_HOSTS
 
-    def load_or_create_workbook(self):
+    def open_database(self):
         """
-        Loads the existing workbook if it exists; otherwise, creates a new Excel workbook.
+        Opens the draw database, importing the existing workbook the first time.
         """
-        if not os.path.exists(self.workbook_path):
-            print(f"Workbook '{self.workbook_path}' not found. Creating a new workbook...")
-            create_workbook(self.workbook_path)
-        self.wb = openpyxl.load_workbook(self.workbook_path)
-        # Use the first worksheet and rename it to "Data"
-        self.ws = self.wb.active
-        self.ws.title = "Data"
+        db = DrawDatabase(self.db_path)
+        if db.count() == 0 and os.path.exists(self.workbook_path):
+            print(f"Draw database is empty. Importing '{self.workbook_path}'...")
+            db.import_xlsx(self.workbook_path)
+        return db
 
-    def _clear_sheet(self):
+    def page_url(self, page, per_page=None):
+        per_page = per_page or self.per_page or DEFAULT_PER_PAGE
+        return f"{self.base_url}/history/singapore/toto/page/{page}/per-page/{per_page}/summary-view"
+
+    async def fetch_page(self, engine, page, per_page=None):
         """
-        Clears all cells in the worksheet.
+        Asynchronously fetches the HTML content of a given page through the FetchEngine
+        (rate limited, retried on 429/5xx/timeouts). With a page cache the request is conditional
+        and a 304 is answered from the cache; in offline mode only the cache is read.
+        Retry accounting is kept under the key (per_page, page).
         """
-        for row in self.ws.iter_rows():
-            for cell in row:
-                cell.value = None
+        per_page = per_page or self.per_page or DEFAULT_PER_PAGE
+        url = self.page_url(page, per_page)
+        key = (per_page, page)
+        if self.offline:
+            text = self.cache.read_text(url)
+            print(f"Page {page} {'replayed from cache' if text is not None else 'is not cached'}.")
+            return page, text
+        print(f"Fetching page {page} from {url}")
+        headers = self.cache.conditional_headers(url) if self.cache else None
+        result = await engine.fetch(url, key=key, headers=headers)
+        if result is None:
+            return page, None
+        if result.status == 304 and self.cache:
+            text = self.cache.read_text(url)
+            if text is not None:
+                print(f"Page {page} not modified, using cached copy.")
+                return page, text
+            # cache entry lost between the request and now: fetch unconditionally
+            result = await engine.fetch(url, key=key)
+            if result is None:
+                return page, None
+        if result.status != 200:
+            print(f"Page {page} returned status {result.status}")
+            return page, None
+        print(f"Page {page} fetched with {len(result.text)} characters.")
+        if self.cache:
+            self.cache.store(url, result.text, result.headers)
+        return page, result.text
 
-    def _fill_header_row(self):
+    def report_fetch_stats(self, engine):
         """
-        Writes the header row to the sheet.
+        Prints the per-page retry accounting and keeps the failed pages on the instance; run()
+        stores the draw spans of failed backfill pages in the database for later gap fills.
         """
-        headers = ["Draw no.", "Date", "no1", "no2", "no3", "no4", "no5", "no6", "Addict. no"]
-        self.ws.append(headers)
+        summary = engine.retry_summary()
+        self.failed_pages = summary["failed"]
+        print(f"{summary['requests']} requests sent; retried pages: {summary['retried'] or 'none'}; "
+              f"failed pages: {summary['failed'] or 'none'}")
+        if summary["resolved"]:
+            print(f"Failed pages recovered or superseded: {summary['resolved']}")
 
-    def read_current_data(self):
+    def parse_page(self, text):
         """
-        Reads current data (excluding the header row) from the workbook and returns a list of tuples.
+        Extracts the draws listed on one history page, in page order (newest first),
+        as (draw_no, date, n1..n6, addl) rows.
         """
-        data = []
-        for row in self.ws.iter_rows(min_row=2, values_only=True):
-            if any(cell is not None for cell in row):
-                data.append(tuple(row))
-        return data
+        return extract_rows(text, self.parse_backend)
 
-    async def fetch_page(self, session, page):
+    async def fetch_and_parse(self, engine, page, pool=None, per_page=None):
         """
-        Asynchronously fetches the HTML content of a given page.
+        Fetches one page and extracts its rows, in the process pool when one is given
+        (only the compact row tuples travel back). Pages whose content hash matches the cached
+        copy reuse the cached rows. Returns (page, rows or None).
         """
-        url = f"https://en.lottolyzer.com/history/singapore/toto/page/{page}/per-page/50/summary-view"
-        print(f"Fetching page {page} from {url}")
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/98.0.4758.102 Safari/537.36"
-            )
-        }
-        try:
-            async with session.get(url, headers=headers, timeout=10) as resp:
-                if resp.status != 200:
-                    print(f"Page {page} returned status {resp.status}")
-                    return page, None
-                text = await resp.text()
-                print(f"Page {page} fetched with {len(text)} characters.")
-                return page, text
-        except Exception as e:
-            print(f"Error fetching page {page}: {e}")
+        per_page = per_page or self.per_page or DEFAULT_PER_PAGE
+        if (per_page, page) in self.prefetched:
+            return page, self.prefetched.pop((per_page, page))
+        _, text = await self.fetch_page(engine, page, per_page)
+        if text is None:
             return page, None
+        url = self.page_url(page, per_page)
+        if self.cache:
+            rows = self.cache.rows_for(url, text)
+            if rows is not None:
+                return page, rows
+        if pool is None:
+            rows = self.parse_page(text)
+        else:
+            loop = asyncio.get_running_loop()
+            rows = await loop.run_in_executor(pool, extract_rows, text, self.parse_backend)
+        if self.cache:
+            self.cache.store_rows(url, rows)
+        return page, rows
 
-    async def get_all_draws(self, max_pages=50):
+    async def probe_per_page(self, engine, known_count=None, largest=None):
         """
-        Asynchronously fetches draw data from pages 1..max_pages.
-        Returns the list of draws sorted in descending order by 'draw'.
+        Requests page 1 with each of PER_PAGE_CANDIDATES (largest first) and keeps the first size the
+        site honours: the page must hold that many draws, or the whole known history when it is smaller.
+        Failed or truncated probes fall through to the next size; sizes above `largest` are not tried.
+        Sets self.per_page and
+        self.site_latest; the accepted page 1 is kept so the backfill does not request it again.
         """
-        all_draws = {}
-        async with aiohttp.ClientSession() as session:
-            tasks = [self.fetch_page(session, page) for page in range(1, max_pages + 1)]
-            pages = await asyncio.gather(*tasks)
-            for page, text in pages:
-                if text is None:
-                    continue
-                soup = BeautifulSoup(text, "html.parser")
-                rows = soup.find_all("tr")
-                page_new_draws = 0
-                for row in rows:
-                    cells = row.find_all("td")
-                    if len(cells) < 4:
+        if self.per_page is not None:
+            return self.per_page
+        candidates = PER_PAGE_CANDIDATES if self.adaptive_page_size else (DEFAULT_PER_PAGE,)
+        candidates = [size for size in candidates if largest is None or size <= largest] or [DEFAULT_PER_PAGE]
+        for candidate in candidates:
+            _, rows = await self.fetch_and_parse(engine, 1, per_page=candidate)
+            expected = candidate if known_count is None else min(candidate, known_count)
+            if rows and (len(rows) >= expected or candidate == DEFAULT_PER_PAGE):
+                for size in candidates:
+                    if size != candidate:
+                        engine.mark_resolved((size, 1), f"probe settled on {candidate} per page")
+                self.per_page = candidate
+                self.site_latest = rows[0][0]
+                self.prefetched[(candidate, 1)] = rows
+                print(f"Using {candidate} draws per page (latest draw on the site: {self.site_latest}).")
+                return candidate
+            print(f"per-page {candidate} not usable ({'no response' if rows is None else f'{len(rows)} draws'}).")
+        self.per_page = DEFAULT_PER_PAGE
+        return self.per_page
+
+    async def latest_site_draw(self):
+        """
+        Newest draw number listed on page 1 (one conditional request with the page cache),
+        or None when the page could not be fetched. The parsed page is kept in self.prefetched,
+        so an incremental run() straight after starts from it instead of requesting it again.
+        """
+        self.prefetched.pop((DEFAULT_PER_PAGE, 1), None)
+        async with FetchEngine(**self.fetch_options) as engine:
+            _, rows = await self.fetch_and_parse(engine, 1, per_page=DEFAULT_PER_PAGE)
+        if rows:
+            self.prefetched[(DEFAULT_PER_PAGE, 1)] = rows
+        return rows[0][0] if rows else None
+
+    def page_limit(self):
+        """
+        Upper bound on the pages the history can fill at the probed page size. Draw numbers are
+        never reused, so the latest draw number bounds the draw count; one page of slack is added.
+        It overshoots when the site's numbering does not start at 1.
+        """
+        per_page = self.per_page or DEFAULT_PER_PAGE
+        if self.site_latest is None:
+            return 50
+        return -(-self.site_latest // per_page) + 1
+
+    def plan_pages(self, known_count=None):
+        """
+        Pages expected to hold the whole history: those covering known_count draws (e.g. the
+        draws already in the database) when given, else page_limit().
+        """
+        per_page = self.per_page or DEFAULT_PER_PAGE
+        if known_count:
+            return min(self.page_limit(), -(-known_count // per_page))
+        return self.page_limit()
+
+    def pages_for_range(self, first, last, per_page=None):
+        """
+        Estimated pages holding draws first..last: draw d sits on page (latest - d) // per_page + 1
+        when the numbering has no holes.
+        """
+        per_page = per_page or self.per_page or DEFAULT_PER_PAGE
+        first_page = max(1, (self.site_latest - last) // per_page + 1)
+        last_page = max(first_page, (self.site_latest - first) // per_page + 1)
+        return first_page, last_page
+
+    async def fetch_draw_range(self, engine, first, last, pool=None, per_page=None):
+        """
+        Fetches the draws numbered first..last (inclusive) from the pages estimated by pages_for_range.
+        Holes in the site's numbering shift draws towards earlier pages, so the window is widened
+        until both ends of the range are seen. Pages that fail are retried at the next smaller page
+        size. Returns {draw_no: row}.
+        """
+        per_page = per_page or self.per_page or DEFAULT_PER_PAGE
+        first_page, last_page = self.pages_for_range(first, last, per_page)
+        found, page_rows = {}, {}
+        pages = list(range(first_page, last_page + 1))
+        while pages:
+            results = await asyncio.gather(*(self.fetch_and_parse(engine, p, pool, per_page) for p in pages))
+            for page, rows in results:
+                page_rows[page] = rows
+                if rows is not None:
+                    found.update((row[0], row) for row in rows if first <= row[0] <= last)
+            pages = []
+            low_page, high_page = min(page_rows), max(page_rows)
+            low_rows, high_rows = page_rows[low_page], page_rows[high_page]
+            if low_rows and low_rows[0][0] < last and low_page > 1:
+                pages.append(low_page - 1)
+            if high_rows and high_rows[-1][0] > first and len(high_rows) == per_page:
+                pages.append(high_page + 1)
+        for page in sorted(p for p, rows in page_rows.items() if rows is None):
+            found.update(await self.refetch_in_smaller_pages(engine, page, per_page, page_rows, pool, first, last))
+        return found
+
+    def page_span(self, page, per_page, page_rows, first=1, last=None):
+        """
+        Draw numbers (first, last) a page should hold, clipped to first..last. The span is bounded by
+        the neighbouring pages in page_rows ({page: rows}) when they were fetched, else estimated
+        from the latest draw.
+        """
+        previous_rows, next_rows = page_rows.get(page - 1), page_rows.get(page + 1)
+        span_last = previous_rows[-1][0] - 1 if previous_rows else self.site_latest - (page - 1) * per_page
+        span_first = next_rows[0][0] + 1 if next_rows else span_last - per_page + 1
+        span_first = max(first, span_first)
+        span_last = min(span_last, last) if last is not None else span_last
+        return span_first, span_last
+
+    async def refetch_in_smaller_pages(self, engine, page, per_page, page_rows, pool=None, first=1, last=None):
+        """
+        Fallback for a page that failed at a large page size: fetches the draws it should have held
+        (page_span, clipped to first..last) with the next smaller size.
+        Returns {draw_no: row}; empty when per_page is already the smallest size.
+        """
+        smaller = [size for size in PER_PAGE_CANDIDATES if size < per_page]
+        if not smaller or self.site_latest is None:
+            return {}
+        span_first, span_last = self.page_span(page, per_page, page_rows, first, last)
+        print(f"Page {page} ({per_page} per page) failed; retrying draws {span_first}-{span_last} "
+              f"with {smaller[0]} per page.")
+        found = await self.fetch_draw_range(engine, span_first, span_last, pool, smaller[0])
+        if found:
+            engine.mark_resolved((per_page, page), f"refetched with {smaller[0]} per page")
+        return found
+
+    async def get_draw_range(self, first, last):
+        """
+        Fetches the draws numbered first..last (inclusive). Returns their rows sorted descending.
+        """
+        rows, _ = await self.get_draw_ranges([(first, last)])
+        return rows
+
+    def merge_ranges(self, ranges):
+        """
+        Sorts inclusive (first, last) draw ranges and merges those less than a page apart,
+        so a page shared by neighbouring ranges is requested once.
+        """
+        per_page = self.per_page or DEFAULT_PER_PAGE
+        merged = []
+        for first, last in sorted(ranges):
+            if merged and first - merged[-1][1] <= per_page:
+                merged[-1] = (merged[-1][0], max(last, merged[-1][1]))
+            else:
+                merged.append((first, last))
+        return merged
+
+    async def get_draw_ranges(self, ranges):
+        """
+        Fetches several draw-number ranges in one session (used to fill holes in the database).
+        The page size probe stops at the smallest size that covers the requested draws, so a few
+        missing draws do not trigger 500-draw pages. Returns (rows sorted descending, absent), where
+        absent lists requested numbers the site does not have; it is only filled for ranges whose
+        pages all arrived.
+        """
+        wanted = set()
+        for first, last in ranges:
+            wanted.update(range(first, last + 1))
+        found, absent = {}, []
+        if not wanted:
+            return [], absent
+        largest = min([size for size in PER_PAGE_CANDIDATES if size >= len(wanted)] or [max(PER_PAGE_CANDIDATES)])
+        async with FetchEngine(**self.fetch_options) as engine:
+            await self.probe_per_page(engine, largest=largest)
+            if self.site_latest is not None:
+                for first, last in self.merge_ranges(ranges):
+                    last = min(last, self.site_latest)
+                    if first > last:
                         continue
-                    try:
-                        draw_num = int(cells[0].get_text(strip=True))
-                    except ValueError:
+                    failures = set(engine.failed_keys())
+                    span = await self.fetch_draw_range(engine, first, last)
+                    found.update((draw_no, row) for draw_no, row in span.items() if draw_no in wanted)
+                    if set(engine.failed_keys()) <= failures:
+                        absent += [d for d in range(first, last + 1) if d in wanted and d not in span]
+            self.report_fetch_stats(engine)
+        return sorted(found.values(), reverse=True), absent
+
+    def fill_gaps(self, db):
+        """
+        Fetches only the pages holding draw numbers missing from the database (holes between the
+        oldest and newest stored draw and the spans of pages that failed in earlier runs, see
+        DrawDatabase.missing_ranges) and merges them into the database.
+        Numbers the site does not list are recorded so they are not requested again.
+        Returns the number of draws added.
+        """
+        gaps = db.missing_ranges()
+        if not gaps:
+            db.resolve_failed_ranges()
+            return 0
+        shown = ", ".join(f"{first}-{last}" if first != last else str(first) for first, last in gaps[:10])
+        print(f"Filling {len(gaps)} gaps in the stored draw numbers: {shown}{' ...' if len(gaps) > 10 else ''}")
+        rows, absent = asyncio.run(self.get_draw_ranges(gaps))
+        changed = db.upsert_rows(rows)
+        if absent:
+            db.mark_absent(absent)
+            print(f"{len(absent)} draw numbers are not listed on the website; they will not be requested again.")
+        still_failed = db.resolve_failed_ranges()
+        if still_failed:
+            print(f"{still_failed} failed page ranges remain; the next run requests them again.")
+        return changed
+
+    async def pipeline_pages(self, engine, max_pages, handle_page, window, pool=None, wide_until=None):
+        """
+        Fetches pages 1..max_pages in order with at most `window` requests in flight and hands
+        each page's rows to handle_page(page, rows) as soon as they are parsed, so parsing overlaps
+        with the remaining downloads. handle_page returns the last page still needed (or None to keep
+        going); requests for later pages are then cancelled and nothing further is scheduled.
+        Pages after `wide_until` (the planned end) are requested one at a time, once every earlier
+        page was handled, so an overshooting plan costs at most one request past the end.
+        """
+        last_needed = max_pages
+        next_page = 1
+        in_flight = {}
+        try:
+            while in_flight or next_page <= last_needed:
+                while next_page <= last_needed and len(in_flight) < (
+                        window if wide_until is None or next_page <= wide_until else 1):
+                    in_flight[asyncio.create_task(self.fetch_and_parse(engine, next_page, pool))] = next_page
+                    next_page += 1
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page = in_flight.pop(task)
+                    if task.cancelled() or page > last_needed:
                         continue
-                    date_val = cells[1].get_text(strip=True)
-                    win_val = cells[2].get_text(strip=True)  # e.g. "3, 9, 10, 12, 27, 41, 50"
-                    addl_val = cells[3].get_text(strip=True)  # e.g. "29"
-                    winning_numbers = [num.strip() for num in win_val.split(",") if num.strip()]
-                    if draw_num not in all_draws:
-                        all_draws[draw_num] = {
-                            "draw": draw_num,
-                            "date": date_val,
-                            "winning_numbers": winning_numbers,
-                            "addl": addl_val
-                        }
-                        page_new_draws += 1
-                print(f"Page {page}: Extracted {page_new_draws} draws.")
-                if page_new_draws == 0:
-                    print(f"No new draws found on page {page}.")
-                    break
-        sorted_draws = sorted(all_draws.values(), key=lambda x: x["draw"], reverse=True)
-        return sorted_draws
-
-    def fill_entire_data_sheet(self, all_draws):
-        """
-        Fills the sheet with draw data (using the first six winning numbers).
-        """
-        for draw_info in all_draws:
-            winning_numbers = draw_info["winning_numbers"][:6]
-            row_data = (draw_info["draw"], draw_info["date"]) + tuple(winning_numbers) + (draw_info["addl"],)
-            self.ws.append(row_data)
-
-    def get_website_data_as_tuples(self, all_draws):
-        """
-        Converts the website draw data into a list of tuples for comparison.
-        """
-        data_tuples = []
-        for draw_info in all_draws:
-            winning_numbers = draw_info["winning_numbers"][:6]
-            row_tuple = (draw_info["draw"], draw_info["date"]) + tuple(winning_numbers) + (draw_info["addl"],)
-            data_tuples.append(row_tuple)
-        return data_tuples
-
-    def run(self):
-        """
-        Main method: checks for network connectivity, loads the workbook, fetches website data asynchronously,
-        compares it with the current data, and if the data differs, deletes the current file and creates a new workbook
-        with the latest data.
-        """
-        if not is_connected():
+                    _, rows = task.result()
+                    limit = handle_page(page, rows)
+                    if limit is not None and limit < last_needed:
+                        last_needed = limit
+                        cancelled = [t for t, p in in_flight.items() if p > last_needed]
+                        for t in cancelled:
+                            t.cancel()
+                        if cancelled:
+                            print(f"Cancelled {len(cancelled)} outstanding page requests after page {last_needed}.")
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def get_all_draws(self, max_pages=None, window=None, known_count=None):
+        """
+        Asynchronously fetches draw data from pages 1..max_pages. The page size is probed first and,
+        without an explicit max_pages, the pages are planned from known_count (the draws already
+        stored, see plan_pages) and capped by page_limit(); pages past the plan are requested one
+        at a time. Pages that fail at a large page size are fetched again in smaller pages.
+        Pages are parsed as they arrive (in a process pool when parse_workers is set); a short page
+        or one without new draws ends the history, so requests for the pages after it are cancelled.
+        Returns the (draw_no, date, n1..n6, addl) rows sorted in descending order by draw number.
+        """
+        all_draws = {}
+        self.failed_ranges = []
+
+        def handle_page(page, rows):
+            if rows is None:
+                return None
+            page_new_draws = 0
+            for row in rows:
+                if row[0] not in all_draws:
+                    all_draws[row[0]] = row
+                    page_new_draws += 1
+            print(f"Page {page}: Extracted {page_new_draws} draws.")
+            if page_new_draws == 0:
+                print(f"No new draws found on page {page}.")
+                return page
+            if len(rows) < self.per_page:
+                return page  # short page: the oldest draws
+            return None
+
+        pool = ProcessPoolExecutor(self.parse_workers) if self.parse_workers and max_pages != 1 else None
+        try:
+            async with FetchEngine(**self.fetch_options) as engine:
+                per_page = await self.probe_per_page(engine, known_count=known_count)
+                planned = self.plan_pages(known_count)
+                max_pages = max_pages or max(planned, self.page_limit())
+                print(f"Planning {min(planned, max_pages)} pages of {per_page} draws (at most {max_pages}).")
+                page_rows = {}
+
+                def handle_or_record(page, rows):
+                    page_rows[page] = rows
+                    return handle_page(page, rows)
+
+                await self.pipeline_pages(engine, max_pages, handle_or_record, window or engine.limit_per_host * 2, pool,
+                                          wide_until=planned)
+                for page in sorted(p for p, rows in page_rows.items() if rows is None):
+                    recovered = await self.refetch_in_smaller_pages(engine, page, per_page, page_rows, pool)
+                    for draw_no, row in recovered.items():
+                        all_draws.setdefault(draw_no, row)
+                    if self.site_latest is not None:
+                        # Kept until every number is stored or known absent, even if recovered
+                        self.failed_ranges.append(self.page_span(page, per_page, page_rows))
+                self.report_fetch_stats(engine)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+        return sorted(all_draws.values(), reverse=True)
+
+    async def get_new_draws(self, latest_known, max_pages=50, window=1):
+        """
+        Incremental fetch: requests page 1 first and moves on to the next page only while
+        every draw on the current page is newer than latest_known (the highest draw number
+        already stored). window > 1 prefetches the following pages speculatively; they are
+        cancelled once the known history is reached. Returns (new draws sorted descending,
+        complete), where complete is False if a page failed before the known history was reached.
+        """
+        new_draws = {}
+        state = {"complete": True}
+
+        def handle_page(page, page_draws):
+            if page_draws is None:
+                state["complete"] = False
+                return page - 1
+            unseen = [row for row in page_draws if row[0] > latest_known]
+            for row in unseen:
+                new_draws[row[0]] = row
+            print(f"Page {page}: {len(unseen)} unseen draws.")
+            if not page_draws or len(unseen) < len(page_draws):
+                return page
+            return None
+
+        async with FetchEngine(**self.fetch_options) as engine:
+            await self.pipeline_pages(engine, max_pages, handle_page, window)
+            self.report_fetch_stats(engine)
+        return sorted(new_draws.values(), reverse=True), state["complete"]
+
+    def run(self, incremental=True):
+        """
+        Main method: checks for network connectivity, fetches website data asynchronously,
+        upserts it into the draw database and brings the workbook up to date: new draws are
+        inserted at the top, and it is only rebuilt when older draws were corrected or filled in.
+        In incremental mode (default, once the database holds draws) only the pages with draws
+        newer than the latest stored draw number are requested, followed by the pages holding any
+        holes in the stored draw numbers; the full history is only downloaded for an empty database.
+        In offline mode the pages are replayed from the page cache.
+        Returns the number of workbook rows written (0 when the workbook is unchanged).
+        """
+        if not self.offline and not self.is_local() and not is_connected():
             print("Please on your network to get latest data for analysis.")
-            return
-
-        self.load_or_create_workbook()
-        current_data = self.read_current_data()
-        print("Current data in workbook:", current_data)
-        print("Fetching all draws asynchronously from the website...")
-        all_draws = asyncio.run(self.get_all_draws(max_pages=50))
-        website_data = self.get_website_data_as_tuples(all_draws)
-        print("Website data:", website_data)
-
-        if current_data == website_data:
-            print("Data is up-to-date. No changes made.")
-        else:
-            print("Data differs. Deleting current file and updating workbook with the latest data...")
-            # Delete current file
-            if os.path.exists(self.workbook_path):
-                try:
-                    os.remove(self.workbook_path)
-                    print(f"Deleted existing file: {self.workbook_path}")
-                except PermissionError as e:
-                    print(f"PermissionError: {e}. Please close the file and try again.")
-                    return
-            # Create new workbook and update with website data
-            create_workbook(self.workbook_path)
-            self.load_or_create_workbook()
-            self._fill_header_row()
-            self.fill_entire_data_sheet(all_draws)
-            self.wb.save(self.workbook_path)
-            print(f"Workbook updated: {self.workbook_path}")
+            self.prefetched.clear()
+            return 0
+
+        db = self.open_database()
+        try:
+            latest_known = db.latest_draw_no()
+            if incremental and latest_known is not None:
+                print(f"Fetching draws newer than {latest_known} from the website...")
+                all_draws, complete = asyncio.run(self.get_new_draws(latest_known, max_pages=50))
+                if not complete:
+                    print("Incremental fetch incomplete; missing draws are picked up by the gap check.")
+            else:
+                print("Fetching all draws asynchronously from the website...")
+                all_draws = asyncio.run(self.get_all_draws(known_count=db.count() or None))
+            count_before = db.count()
+            changed = db.upsert_rows(all_draws)
+            if self.failed_ranges:
+                db.record_failed_ranges(self.failed_ranges)
+            corrected = changed - (db.count() - count_before)
+            gap_filled = self.fill_gaps(db)
+            changed += gap_filled
+            print(f"{changed} draws added or updated in {self.db_path}")
+
+            written = 0
+            try:
+                written = db.sync_xlsx(self.workbook_path, rebuild=corrected > 0 or gap_filled > 0)
+                if written:
+                    print(f"Workbook updated: {self.workbook_path}")
+                else:
+                    print("Data is up-to-date. No changes made.")
+            except PermissionError as e:
+                print(f"PermissionError: {e}. Please close the file and try again.")
+            return written
+        finally:
+            self.prefetched.clear()
+            db.close()
 
 if __name__ == "__main__":
-    analyzer = TotoDataFetcher()
+    analyzer = TotoDataFetcher(parse_workers=os.cpu_count() or 1)
     analyzer.run()
@@ -6,6 +6,8 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget,
 from PyQt6.QtCore import Qt
 from docx import Document
 from datetime import datetime
+from Data_store import load_storage_namespace
+from Math_util import MathUtils
 
 # New helper: enforce strictly increasing order for the main 6 numbers.
 def enforce_strictly_increasing(nums):
@@ -91,20 +93,25 @@ class AIModelGraphAnalyzer(QMainWindow):
             QMessageBox.critical(self, "Error", f"{self.data_storage_file} not found!")
             return
         try:
-            ns = {}
-            with open(self.data_storage_file, "r", encoding="utf-8") as f:
-                exec(f.read(), ns)
+            ns = load_storage_namespace(self.data_storage_file)
             if "graph_plot_info" not in ns:
                 QMessageBox.critical(self, "Error", "graph_plot_info not found in Data_storage_Lib.py")
                 return
             self.graph_plot_info = ns["graph_plot_info"]
             for key in ["C", "D", "E", "F", "G", "H", "I"]:
                 self.allowed_lists[key] = ns.get(key, list(range(1, 50)))
-            # Load list_percent1 to list_percent7; convert lists to dicts if necessary.
+            # Load list_percent1 to list_percent7; derive them from the raw counts when available,
+            # otherwise convert the 'Value X: (Y%)' lists to dicts.
+            math_utils = MathUtils()
+            position_counts = ns.get("position_counts")
+            draw_total = ns.get("draw_total", 0)
+            has_counts = math_utils.has_counts(position_counts, draw_total)
             for i in range(1, 8):
                 key = f"list_percent{i}"
                 value = ns.get(key, None)
-                if value is None:
+                if has_counts:
+                    self.list_percentages[key] = math_utils.position_percent_dict(position_counts, draw_total, i - 1)
+                elif value is None:
                     self.list_percentages[key] = {x: 0 for x in range(1, 50)}
                 elif isinstance(value, list):
                     d = {}
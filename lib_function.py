@@ -1,14 +1,15 @@
 import os
 from Scripwriter import BackendScriptWriter
 import ast
-from ExcelMacroRunner import excel_functions
+from Draw_matrix import DrawMatrix
+from Frequency_engine import RollingFrequencies
 import matplotlib.pyplot as plt
 import openpyxl
-import win32com.client
 import docx 
 import re
 from collections import defaultdict
 from Math_util import MathUtils
+from Data_store import LazyStorageNamespace
       
 
 class Lib_functions:
@@ -23,6 +24,7 @@ class Lib_functions:
             'list7': ['I', 'list_percent7', 'list_highest7','list_lowest7'],
         }
         self.filename = "Data_storage_Lib.py"  # Replace with your filename
+        self.workbook_name = "database_analysis.xlsx"
         self.list_activation = list_activation
         keys = list(self.Lib_list_name.keys())
         for key in keys:
@@ -33,90 +35,48 @@ class Lib_functions:
         
 
     def list_percent_function(self):
+        """
+        Derives list_percent*, list_highest* and list_lowest* (top/bottom 3) plus position_counts and
+        draw_total from the all-time PositionFrequencies, committed in one write. The counts come from
+        the persisted RollingFrequencies state, so only draws added since the last run are counted.
+        With a single list activated only that list's variables are replaced.
+        """
         scriptcalculator = BackendScriptWriter()
-        excel_activation = excel_functions()
-
-        if self.list_activation == "All":
-            keys = list(self.Lib_list_name.keys())
-            for key in keys:
-                self.list_name = self.Lib_list_name[key][0]
-                self.store_data_list = self.Lib_list_name[key][1]
-                self.store_list_highest = self.Lib_list_name[key][2]
-                self.store_list_lowest = self.Lib_list_name[key][3]
-
-                list_values = excel_activation.get_value_in_column('Data', self.list_name)
-
-                total_sum = len(list_values)  # Calculate the total sum correctly
-                print(total_sum)
-                print("Total sum:", total_sum)
-                i = 0
-                percent_list = []
-                percent_highest = {}
-                percent_lowest={}
-                count_value = excel_activation.get_value_in_column('Data', self.list_name)
-
-                value_counts = {}  # Create a dictionary to store the count of each value
-                for value in count_value:
-                    if value in value_counts:
-                        value_counts[value] += 1
-                    else:
-                        value_counts[value] = 1
-
-                for value, count in value_counts.items():
-                    percent = (count / len(count_value)) * 100  # Calculate the percentage for each group
-                    print(f"Value {value}: ({percent:.2f}%)")
-                    percent_list.append(f"Value {value}: ({percent:.2f}%)")
-                    percent_highest[value] = percent
-                    percent_lowest [value]=percent
-
-                percent_2 = percent_list
-                top_3_percent_highest = sorted(percent_highest.items(), key=lambda x: x[1], reverse=True)[:3]
-                top_3_percent_lowest = sorted(percent_highest.items(), key=lambda x: x[1])[:3]
-                scriptcalculator.overwritelist_script(self.filename, self.store_data_list, percent_2)
-                scriptcalculator.overwritelist_script(self.filename, self.store_list_highest, top_3_percent_highest)
-                scriptcalculator.overwritelist_script(self.filename, self.store_list_lowest, top_3_percent_lowest)
-                
-                print("Percentages calculated and stored in the list.")
-
-        else:
-            self.list_name = self.Lib_list_name[self.list_activation][0]
-            self.store_data_list = self.Lib_list_name[self.list_activation][1]
-            self.store_list_highest = self.Lib_list_name[self.list_activation][2]
+        matrix = DrawMatrix.get(self.workbook_name, 'Data')
+        rolling = RollingFrequencies.load()
+        appended = rolling.sync(matrix.draw_nos, matrix.numbers)
+        rolling.save()
+        print("Frequency state rebuilt from the full history." if appended < 0
+              else f"Frequency state updated with {appended} new draws.")
+        frequencies = rolling.frequencies()
 
-            list_values = excel_activation.get_value_in_column('Data', self.list_name)
-
-            total_sum = len(list_values)  # Calculate the total sum correctly
-            print(total_sum)
+        keys = list(self.Lib_list_name.keys())
+        activated = keys if self.list_activation == "All" else [self.list_activation]
+        updates = {}  # Committed to the script in one write once every list is calculated
+        for key in activated:
+            position = keys.index(key)
+            self.list_name = self.Lib_list_name[key][0]
+            self.store_data_list = self.Lib_list_name[key][1]
+            self.store_list_highest = self.Lib_list_name[key][2]
+            self.store_list_lowest = self.Lib_list_name[key][3]
+
+            total_sum = int(frequencies.totals[position])
             print("Total sum:", total_sum)
-            i = 0
-            percent_list = []
-            percent_highest = {}
-            percent_lowest={}
-            count_value = excel_activation.get_value_in_column('Data', self.list_name)
-
-            value_counts = {}  # Create a dictionary to store the count of each value
-            for value in count_value:
-                if value in value_counts:
-                    value_counts[value] += 1
-                else:
-                    value_counts[value] = 1
-
-            for value, count in value_counts.items():
-                percent = (count / len(count_value)) * 100  # Calculate the percentage for each group
-                print(f"Value {value}: ({percent:.2f}%)")
-                percent_list.append(f"Value {value}: ({percent:.2f}%)")
-                percent_highest[value] = percent
-                percent_lowest [value]=percent
-
-            percent_2 = percent_list
-            top_3_percent_highest = sorted(percent_highest.items(), key=lambda x: x[1], reverse=True)[:3]
-            top_3_percent_lowest = sorted(percent_highest.items(), key=lambda x: x[1])[:3]
-            scriptcalculator.overwritelist_script(self.filename, self.store_data_list, percent_2)
-            scriptcalculator.overwritelist_script(self.filename, self.store_list_highest, top_3_percent_highest)
-            scriptcalculator.overwritelist_script(self.filename, self.store_list_lowest, top_3_percent_lowest)
-            
-            print("Percentages calculated and stored in the list.")
-
+            percent_2 = frequencies.percent_list(position)
+            top_3_percent_highest = frequencies.top_k(position, 3)
+            top_3_percent_lowest = frequencies.bottom_k(position, 3)
+            updates[self.store_data_list] = percent_2
+            updates[self.store_list_highest] = top_3_percent_highest
+            updates[self.store_list_lowest] = top_3_percent_lowest
+            print(f"{self.store_data_list}: {len(percent_2)} values, highest {top_3_percent_highest}, "
+                  f"lowest {top_3_percent_lowest}")
+
+        updates['position_counts'] = frequencies.counts_list()
+        updates['draw_total'] = total_sum
+        scriptcalculator.overwrite_variables_script(self.filename, updates)
+        print("Percentages calculated and stored in the list.")
+
+        if self.list_activation != "All":
             return percent_2, top_3_percent_highest, top_3_percent_lowest
         
         
@@ -162,25 +122,36 @@ class total_list_cal_script:
     """
         x = BackendScriptWriter()
         Math=MathUtils()
-        L = x.get_total_list_value('Data_storage_Lib.py', 'list_percent_call_all')
-    
-        lists = Math.extract_and_combine_percentages(L)
-        if not lists:
-            print("No lists found in the script.")
-            return []
-    
-        total_percent = x.variable_get_count('Data_storage_Lib.py', 'list_percent_call_all')
-        if total_percent == 0:
-            print("Total percentage count is zero, cannot normalize.")
-            return []
-    
-        final_percentages = [f'{value_name}: ({(total / total_percent) :.2f}%)' for value_name, total in lists]
+        storage = LazyStorageNamespace('Data_storage_Lib.py')
+        position_counts = storage.get('position_counts')
+        draw_total = storage.get('draw_total', 0)
+
+        if Math.has_counts(position_counts, draw_total):
+            # Exact percentages straight from the raw counts, no string parsing
+            totals = Math.total_percent_dict(position_counts, draw_total)
+            final_percentages = [f'Value {value}: ({percent:.2f}%)' for value, percent in sorted(totals.items())]
+        else:
+            L = x.get_total_list_value('Data_storage_Lib.py', 'list_percent_call_all')
+        
+            lists = Math.extract_and_combine_percentages(L)
+            if not lists:
+                print("No lists found in the script.")
+                return []
+        
+            total_percent = x.variable_get_count('Data_storage_Lib.py', 'list_percent_call_all')
+            if total_percent == 0:
+                print("Total percentage count is zero, cannot normalize.")
+                return []
+        
+            final_percentages = [f'{value_name}: ({(total / total_percent) :.2f}%)' for value_name, total in lists]
         sorted_percentage = sorted(final_percentages, key=lambda x: float(x.split(':')[1].strip().replace('(', '').replace(')', '').replace('%', '')), reverse=True)
         sorted_highest_three = sorted_percentage[:3]
         sorted_lowest_three = sorted_percentage[-3:]
-        x.overwritelist_script('Data_storage_Lib.py', 'total_percent_list', sorted_percentage)
-        x.overwritelist_script('Data_storage_Lib.py', 'total_percent_highest3', sorted_highest_three)
-        x.overwritelist_script('Data_storage_Lib.py', 'total_percent_lowest3', sorted_lowest_three)
+        x.overwrite_variables_script('Data_storage_Lib.py', {
+            'total_percent_list': sorted_percentage,
+            'total_percent_highest3': sorted_highest_three,
+            'total_percent_lowest3': sorted_lowest_three,
+        })
     
         print("Normalized Percentages for all lists:")
         for percentage in final_percentages:
@@ -10,6 +10,7 @@ from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSettings
 from PySide6.QtGui import QFont, QKeyEvent
 import numpy as np
 import matplotlib.pyplot as plt
+from Data_store import load_storage_namespace
 
 # SettingsDialog: Pre-terminal configuration window
 class SettingsDialog(QDialog):
@@ -420,10 +421,11 @@ Available commands:
             self.update_terminal("Main: No result file found.")
         self.update_terminal("Main: Updating Data_Storage_Lib.py...")
         try:
-            subprocess.run(["python", os.path.join(os.getcwd(), "Data_storage_Lib.py")], timeout=10)
+            # Rebuild the snapshot now so the graph tool starts without evaluating the source
+            load_storage_namespace(os.path.join(os.getcwd(), "Data_storage_Lib.py"))
             self.update_terminal("Main: Data_Storage_Lib.py updated successfully.")
-        except subprocess.TimeoutExpired:
-            self.update_terminal("Main: Data_Storage_Lib.py update timed out.")
+        except Exception as e:
+            self.update_terminal(f"Main: ERROR: Data_Storage_Lib.py update failed: {e}")
         self.input_field.setReadOnly(False)
         self.input_field.clear()
         self.input_field.setStyleSheet(f"color: {self.text_color};")
@@ -434,7 +436,6 @@ Available commands:
         self.graph_container.show()  # Show graph container when activated
         from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit
         import pyqtgraph as pg
-        import importlib.util
         from sklearn.linear_model import LinearRegression
         from sklearn.neighbors import KNeighborsRegressor
         from sklearn.preprocessing import StandardScaler
@@ -466,11 +467,9 @@ Available commands:
                 right_layout.addLayout(btn_layout)
                 
                 ds_path = os.path.join(os.getcwd(), "Data_storage_Lib.py")
-                spec = importlib.util.spec_from_file_location("Data_storage_Lib", ds_path)
-                ds_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(ds_module)
-                self.graph_plot_info = getattr(ds_module, "graph_plot_info", {})
-                self.predict_dict = getattr(ds_module, "predict_dict", {})
+                ds_namespace = load_storage_namespace(ds_path)
+                self.graph_plot_info = ds_namespace.get("graph_plot_info", {})
+                self.predict_dict = ds_namespace.get("predict_dict", {})
                 self.prediction_index = 1
                 self.is_total_predict = False
                 self.best_prediction_key = None
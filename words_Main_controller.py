@@ -7,6 +7,7 @@ from docx.shared import Pt
 from docx.enum.text import WD_BREAK
 from Math_util import MathUtils
 from words_function import Wordfunctions
+from Draw_matrix import DrawMatrix
 # Function to generate the Word document
 class ExcelToWordConverter: 
     def short_prob_scanner(self,filename, sheet, start_col, end_col, row_set):
@@ -31,7 +32,11 @@ class ExcelToWordConverter:
 
     # Read the Excel sheet into a DataFrame
         print(f"Reading sheet '{sheet}' from Excel file...")
-        df = pd.read_excel(filename, sheet_name=sheet, header=0, usecols=f"{start_col}:{end_col}")
+        try:
+            headers, rows = DrawMatrix.get(filename, sheet).table(start_col, end_col)
+            df = pd.DataFrame(rows, columns=headers)
+        except ValueError:  # columns outside the draw layout (A..I): read them directly
+            df = pd.read_excel(filename, sheet_name=sheet, header=0, usecols=f"{start_col}:{end_col}")
         print(f"Successfully read {len(df)} rows and {len(df.columns)} columns.")
 
     # Create a Word document